@@ -83,6 +83,10 @@ def cli(ctx: click.Context, chdir: Optional[str], log_level: str):
     """
     ctx.ensure_object(dict)
     ctx.obj["CHDIR"] = Path.cwd() if chdir is None else Path(chdir).absolute()
+    # Only surface each deprecation warning once per CLI invocation. This used to be
+    # set globally on import of feast.feature_store, which clobbered the warning
+    # configuration of applications embedding Feast.
+    warnings.simplefilter("once", DeprecationWarning)
     try:
         level = getattr(logging, log_level.upper())
         logging.basicConfig(
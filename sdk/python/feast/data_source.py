@@ -208,6 +208,10 @@ class DataSource(ABC):
     tags: Dict[str, str]
     owner: str
 
+    # Lazily populated by get_table_column_names_and_types_cached; not part of
+    # the proto representation.
+    _cached_table_column_names_and_types: Optional[Tuple[Tuple[str, str], ...]] = None
+
     def __init__(
         self,
         *,
@@ -376,6 +380,24 @@ class DataSource(ABC):
         """
         raise NotImplementedError
 
+    def get_table_column_names_and_types_cached(
+        self, config: RepoConfig
+    ) -> Tuple[Tuple[str, str], ...]:
+        """
+        Returns the list of column names and raw column types, memoized on the
+        source object. Describing the table can be a network round-trip for
+        warehouse sources; registry cache refreshes rebuild source objects and
+        thereby drop stale entries.
+
+        Args:
+            config: Configuration object used to configure a feature store.
+        """
+        if self._cached_table_column_names_and_types is None:
+            self._cached_table_column_names_and_types = tuple(
+                self.get_table_column_names_and_types(config)
+            )
+        return self._cached_table_column_names_and_types
+
     def get_table_query_string(self) -> str:
         """
         Returns a string that can directly be used to reference this table in SQL.
@@ -1,6 +1,6 @@
 import warnings
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from google.protobuf.json_format import MessageToJson
 from typeguard import typechecked
@@ -50,6 +50,11 @@ class FeatureService:
     last_updated_timestamp: Optional[datetime] = None
     logging_config: Optional[LoggingConfig] = None
 
+    # Lazily computed caches used by the online retrieval path; not part of
+    # the proto representation.
+    _spec_digest: Optional[bytes] = None
+    _cached_feature_refs: Optional[Tuple[str, ...]] = None
+
     @log_exceptions
     def __init__(
         self,
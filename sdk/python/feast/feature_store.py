@@ -11,11 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
+import atexit
 import copy
 import itertools
+import logging
 import os
+import threading
+import time
 import warnings
-from collections import Counter, defaultdict
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import (
@@ -30,17 +37,15 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    Type,
     Union,
     cast,
 )
 
-import pandas as pd
-import pyarrow as pa
-from colorama import Fore, Style
+import numpy as np
 from google.protobuf.timestamp_pb2 import Timestamp
-from tqdm import tqdm
 
-from feast import feature_server, ui_server, utils
+from feast import utils
 from feast.base_feature_view import BaseFeatureView
 from feast.batch_feature_view import BatchFeatureView
 from feast.data_source import DataSource, PushMode
@@ -73,6 +78,7 @@ from feast.infra.provider import Provider, RetrievalJob, get_provider
 from feast.infra.registry_stores.sql import SqlRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.online_response import OnlineResponse
+from feast.protos.feast.core.InfraObject_pb2 import Infra as InfraProto
 from feast.protos.feast.serving.ServingService_pb2 import (
     FieldStatus,
     GetOnlineFeaturesResponse,
@@ -80,7 +86,7 @@ from feast.protos.feast.serving.ServingService_pb2 import (
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import RepeatedValue, Value
 from feast.registry import BaseRegistry, Registry
-from feast.repo_config import RepoConfig, load_repo_config
+from feast.repo_config import RegistryConfig, RepoConfig, load_repo_config
 from feast.repo_contents import RepoContents
 from feast.request_feature_view import RequestFeatureView
 from feast.saved_dataset import SavedDataset, SavedDatasetStorage, ValidationReference
@@ -89,15 +95,71 @@ from feast.type_map import (
     feast_value_type_to_python_type,
     python_values_to_proto_values,
 )
-from feast.usage import log_exceptions, log_exceptions_and_usage, set_usage_attribute
+from feast.usage import (
+    log_exceptions,
+    log_exceptions_and_usage,
+    log_sampled_usage,
+    set_usage_attribute,
+)
 from feast.value_type import ValueType
 from feast.version import get_version
 
-warnings.simplefilter("once", DeprecationWarning)
-
 if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
     from feast.embedded_go.online_features_service import EmbeddedOnlineFeatureServer
 
+# Deprecation and experimental-feature warnings already emitted in this process.
+# warnings.warn walks the stack and matches filters on every call, which is
+# measurable on hot entry points, so each message is only raised once.
+_warned_once: Set[str] = set()
+
+
+# Row-slice size used when converting large DataFrames to Arrow for offline writes.
+_OFFLINE_WRITE_BATCH_ROWS = 65536
+
+# Opt-in client-side batching for feature logs. When FEAST_LOG_BATCH_SIZE is set
+# to a positive number of rows, Arrow tables passed to write_logged_features are
+# buffered and flushed to the offline store in larger batches, either when the
+# buffered row count reaches the batch size or after FEAST_LOG_BATCH_MS
+# milliseconds, whichever comes first.
+_LOG_BATCH_SIZE = int(os.getenv("FEAST_LOG_BATCH_SIZE", "0"))
+_LOG_BATCH_INTERVAL_SECONDS = int(os.getenv("FEAST_LOG_BATCH_MS", "200")) / 1000.0
+
+_logger = logging.getLogger(__name__)
+
+
+def _default_tqdm_builder(length):
+    from tqdm import tqdm
+
+    return tqdm(total=length, ncols=100)
+
+
+def _warn_once(message: str, category: Type[Warning] = UserWarning):
+    if message not in _warned_once:
+        _warned_once.add(message)
+        warnings.warn(message, category, stacklevel=3)
+
+
+def _warn_if_slow_protobuf_implementation():
+    """Warns once if the pure-Python protobuf runtime is active.
+
+    The online retrieval path constructs Value/Timestamp/FeatureVector messages
+    in tight loops, and the pure-Python runtime is over an order of magnitude
+    slower than the upb/C++ backed one.
+    """
+    from google.protobuf.internal import api_implementation
+
+    if api_implementation.Type() == "python":
+        _warn_once(
+            "The pure-Python protobuf implementation is in use. Online feature "
+            "retrieval is significantly faster with the native implementation; "
+            "reinstall the protobuf package with its binary extension or set "
+            "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=cpp.",
+            RuntimeWarning,
+        )
+
 
 class FeatureStore:
     """
@@ -109,11 +171,52 @@ class FeatureStore:
         config (optional): Configuration object used to configure the feature store.
     """
 
+    __slots__ = (
+        "config",
+        "repo_path",
+        "_registry",
+        "_registry_config",
+        "_provider",
+        "_go_server",
+        "_feature_service_refs_cache",
+        "_feature_views_to_use_cache",
+        "_push_source_index_cache",
+        "_entity_maps_cache",
+        "_log_buffer",
+        "_log_buffer_lock",
+        "_log_flusher",
+        "_saved_dataset_cache",
+        "_validation_reference_cache",
+        "_go_server_lock",
+    )
+
     config: RepoConfig
     repo_path: Path
     _registry: BaseRegistry
     _provider: Provider
     _go_server: "EmbeddedOnlineFeatureServer"
+    _registry_config: RegistryConfig
+    _feature_service_refs_cache: Dict[str, Tuple[Tuple[str, ...], float]]
+    _feature_views_to_use_cache: Dict[
+        Tuple[Optional[bytes], bool],
+        Tuple[
+            Tuple[
+                List[FeatureView], List[RequestFeatureView], List[OnDemandFeatureView]
+            ],
+            float,
+        ],
+    ]
+    _push_source_index_cache: Optional[Tuple[Dict[str, List[FeatureView]], float]]
+    _entity_maps_cache: Dict[
+        Tuple[Tuple[str, str, Tuple[Tuple[str, str], ...]], ...],
+        Tuple[Tuple[Dict[str, str], Dict[str, ValueType], Set[str]], float],
+    ]
+    _log_buffer: Dict[str, Tuple[FeatureService, List["pa.Table"]]]
+    _log_buffer_lock: threading.Lock
+    _log_flusher: Optional[threading.Thread]
+    _saved_dataset_cache: Dict[str, Tuple[SavedDataset, float]]
+    _validation_reference_cache: Dict[str, Tuple[ValidationReference, float]]
+    _go_server_lock: threading.Lock
 
     @log_exceptions
     def __init__(
@@ -134,11 +237,11 @@ class FeatureStore:
             self.config = config
         elif repo_path is not None:
             self.repo_path = Path(repo_path)
-            self.config = load_repo_config(Path(repo_path))
+            self.config = load_repo_config(self.repo_path)
         else:
             raise ValueError("Please specify one of repo_path or config.")
 
-        registry_config = self.config.get_registry_config()
+        registry_config = self._registry_config = self.config.get_registry_config()
         if registry_config.registry_type == "sql":
             self._registry = SqlRegistry(registry_config, None)
         else:
@@ -147,6 +250,21 @@ class FeatureStore:
             self._registry = r
         self._provider = get_provider(self.config, self.repo_path)
         self._go_server = None
+        self._feature_service_refs_cache = {}
+        self._feature_views_to_use_cache = {}
+        self._push_source_index_cache = None
+        self._entity_maps_cache = {}
+        self._log_buffer = {}
+        self._log_buffer_lock = threading.Lock()
+        self._log_flusher = None
+        self._saved_dataset_cache = {}
+        self._validation_reference_cache = {}
+        self._go_server_lock = threading.Lock()
+        if self.config.go_feature_serving or self.config.go_feature_retrieval:
+            # Boot the Go subprocess in the background so the first serving
+            # call does not pay the cold-start cost.
+            threading.Thread(target=self._warm_up_go_server, daemon=True).start()
+        _warn_if_slow_protobuf_implementation()
 
     @log_exceptions
     def version(self) -> str:
@@ -182,11 +300,16 @@ class FeatureStore:
         greater than 0, then once the cache becomes stale (more time than the TTL has passed), a new cache will be
         downloaded synchronously, which may increase latencies if the triggering method is get_online_features().
         """
-        registry_config = self.config.get_registry_config()
-        registry = Registry(registry_config, repo_path=self.repo_path)
+        registry = Registry(self._registry_config, repo_path=self.repo_path)
         registry.refresh(self.config.project)
 
         self._registry = registry
+        self._feature_service_refs_cache.clear()
+        self._feature_views_to_use_cache.clear()
+        self._push_source_index_cache = None
+        self._entity_maps_cache.clear()
+        self._saved_dataset_cache.clear()
+        self._validation_reference_cache.clear()
 
     @log_exceptions_and_usage
     def list_entities(self, allow_cache: bool = False) -> List[Entity]:
@@ -258,14 +381,14 @@ class FeatureStore:
         allow_cache: bool = False,
         hide_dummy_entity: bool = True,
     ) -> List[FeatureView]:
-        feature_views = []
-        for fv in self._registry.list_feature_views(
+        feature_views = self._registry.list_feature_views(
             self.project, allow_cache=allow_cache
-        ):
-            if hide_dummy_entity and fv.entities[0] == DUMMY_ENTITY_NAME:
-                fv.entities = []
-                fv.entity_columns = []
-            feature_views.append(fv)
+        )
+        if hide_dummy_entity:
+            for fv in feature_views:
+                if fv.has_dummy_entity and fv.entities:
+                    fv.entities = []
+                    fv.entity_columns = []
         return feature_views
 
     def _list_stream_feature_views(
@@ -273,14 +396,14 @@ class FeatureStore:
         allow_cache: bool = False,
         hide_dummy_entity: bool = True,
     ) -> List[StreamFeatureView]:
-        stream_feature_views = []
-        for sfv in self._registry.list_stream_feature_views(
+        stream_feature_views = self._registry.list_stream_feature_views(
             self.project, allow_cache=allow_cache
-        ):
-            if hide_dummy_entity and sfv.entities[0] == DUMMY_ENTITY_NAME:
-                sfv.entities = []
-                sfv.entity_columns = []
-            stream_feature_views.append(sfv)
+        )
+        if hide_dummy_entity:
+            for sfv in stream_feature_views:
+                if sfv.has_dummy_entity and sfv.entities:
+                    sfv.entities = []
+                    sfv.entity_columns = []
         return stream_feature_views
 
     @log_exceptions_and_usage
@@ -322,7 +445,7 @@ class FeatureStore:
         """
         return self._registry.list_data_sources(self.project, allow_cache=allow_cache)
 
-    @log_exceptions_and_usage
+    @log_sampled_usage
     def get_entity(self, name: str, allow_registry_cache: bool = False) -> Entity:
         """
         Retrieves an entity.
@@ -341,7 +464,7 @@ class FeatureStore:
             name, self.project, allow_cache=allow_registry_cache
         )
 
-    @log_exceptions_and_usage
+    @log_sampled_usage
     def get_feature_service(
         self, name: str, allow_cache: bool = False
     ) -> FeatureService:
@@ -360,7 +483,7 @@ class FeatureStore:
         """
         return self._registry.get_feature_service(name, self.project, allow_cache)
 
-    @log_exceptions_and_usage
+    @log_sampled_usage
     def get_feature_view(
         self, name: str, allow_registry_cache: bool = False
     ) -> FeatureView:
@@ -388,11 +511,15 @@ class FeatureStore:
         feature_view = self._registry.get_feature_view(
             name, self.project, allow_cache=allow_registry_cache
         )
-        if hide_dummy_entity and feature_view.entities[0] == DUMMY_ENTITY_NAME:
+        if (
+            hide_dummy_entity
+            and feature_view.has_dummy_entity
+            and feature_view.entities
+        ):
             feature_view.entities = []
         return feature_view
 
-    @log_exceptions_and_usage
+    @log_sampled_usage
     def get_stream_feature_view(
         self, name: str, allow_registry_cache: bool = False
     ) -> StreamFeatureView:
@@ -422,7 +549,11 @@ class FeatureStore:
         stream_feature_view = self._registry.get_stream_feature_view(
             name, self.project, allow_cache=allow_registry_cache
         )
-        if hide_dummy_entity and stream_feature_view.entities[0] == DUMMY_ENTITY_NAME:
+        if (
+            hide_dummy_entity
+            and stream_feature_view.has_dummy_entity
+            and stream_feature_view.entities
+        ):
             stream_feature_view.entities = []
         return stream_feature_view
 
@@ -494,28 +625,58 @@ class FeatureStore:
         if not _features:
             raise ValueError("No features specified for retrieval")
 
-        _feature_refs = []
         if isinstance(_features, FeatureService):
-            feature_service_from_registry = self.get_feature_service(
-                _features.name, allow_cache
+            return list(self._get_feature_service_refs(_features, allow_cache))
+
+        assert isinstance(_features, list)
+        return _features
+
+    def _get_feature_service_refs(
+        self, feature_service: FeatureService, allow_cache: bool = False
+    ) -> Tuple[str, ...]:
+        """Returns the feature references defined by a feature service.
+
+        The references are cached per feature service name, since they are rebuilt on
+        every online retrieval otherwise. The cache is invalidated whenever the
+        registry is updated (e.g. by apply or refresh_registry) and expires on
+        the registry cache TTL, so a long-running process picks up feature
+        services re-applied from elsewhere.
+        """
+        cached = self._feature_service_refs_cache.get(feature_service.name)
+        if cached is not None:
+            cached_refs, cached_at = cached
+            ttl = self._registry_config.cache_ttl_seconds
+            if ttl <= 0 or time.monotonic() - cached_at < ttl:
+                return cached_refs
+
+        feature_service_from_registry = self.get_feature_service(
+            feature_service.name, allow_cache
+        )
+        if _feature_service_spec_digest(
+            feature_service_from_registry
+        ) != _feature_service_spec_digest(feature_service):
+            warnings.warn(
+                "The FeatureService object that has been passed in as an argument is "
+                "inconsistent with the version from the registry. Potentially a newer version "
+                "of the FeatureService has been applied to the registry."
             )
-            if feature_service_from_registry != _features:
-                warnings.warn(
-                    "The FeatureService object that has been passed in as an argument is "
-                    "inconsistent with the version from the registry. Potentially a newer version "
-                    "of the FeatureService has been applied to the registry."
-                )
+        # The feature service object may be shared through a cached registry, so the
+        # computed refs are also frozen on it; this lets sibling FeatureStore
+        # instances skip the string construction entirely.
+        feature_refs = feature_service_from_registry._cached_feature_refs
+        if feature_refs is None:
+            refs: List[str] = []
             for projection in feature_service_from_registry.feature_view_projections:
-                _feature_refs.extend(
-                    [
-                        f"{projection.name_to_use()}:{f.name}"
-                        for f in projection.features
-                    ]
-                )
-        else:
-            assert isinstance(_features, list)
-            _feature_refs = _features
-        return _feature_refs
+                # Resolve the projection name once per projection instead of per feature.
+                prefix = projection.name_to_use() + ":"
+                refs.extend(prefix + f.name for f in projection.features)
+            feature_refs = tuple(refs)
+            feature_service_from_registry._cached_feature_refs = feature_refs
+        self._feature_service_refs_cache[feature_service.name] = (
+            feature_refs,
+            time.monotonic(),
+        )
+        return feature_refs
 
     def _should_use_plan(self):
         """Returns True if plan and _apply_diffs should be used, False otherwise."""
@@ -542,12 +703,12 @@ class FeatureStore:
         set_usage_attribute("odfv", bool(odfvs_to_update))
 
         _validate_feature_views(
-            [
-                *views_to_update,
-                *odfvs_to_update,
-                *request_views_to_update,
-                *sfvs_to_update,
-            ]
+            itertools.chain(
+                views_to_update,
+                odfvs_to_update,
+                request_views_to_update,
+                sfvs_to_update,
+            )
         )
 
     def _make_inferences(
@@ -572,8 +733,10 @@ class FeatureStore:
             [view.batch_source for view in sfvs_to_update], self.config
         )
 
-        # New feature views may reference previously applied entities.
-        entities = self._list_entities()
+        # New feature views may reference previously applied entities. The cached
+        # registry proto is kept up to date by apply, so avoid refetching the full
+        # registry from the backing store here.
+        entities = self._list_entities(allow_cache=True)
         update_feature_views_with_inferred_features_and_entities(
             views_to_update, entities + entities_to_update, self.config
         )
@@ -591,7 +754,8 @@ class FeatureStore:
             odfv.infer_features()
 
         fvs_to_update_map = {
-            view.name: view for view in [*views_to_update, *sfvs_to_update]
+            view.name: view
+            for view in itertools.chain(views_to_update, sfvs_to_update)
         }
         for feature_service in feature_services_to_update:
             feature_service.infer_features(fvs_to_update=fvs_to_update_map)
@@ -615,26 +779,28 @@ class FeatureStore:
         feature_views_to_materialize: List[FeatureView] = []
 
         if feature_views is None:
-            feature_views_to_materialize = self._list_feature_views(
-                hide_dummy_entity=False
-            )
             feature_views_to_materialize = [
-                fv for fv in feature_views_to_materialize if fv.online
-            ]
-            stream_feature_views_to_materialize = self._list_stream_feature_views(
-                hide_dummy_entity=False
-            )
-            feature_views_to_materialize += [
-                sfv for sfv in stream_feature_views_to_materialize if sfv.online
+                fv
+                for fv in itertools.chain(
+                    self._list_feature_views(hide_dummy_entity=False),
+                    self._list_stream_feature_views(hide_dummy_entity=False),
+                )
+                if fv.online
             ]
         else:
+            # Fetch the registry contents once and resolve every requested name with a
+            # dict lookup rather than up to two registry queries per name.
+            feature_views_by_name = {
+                fv.name: fv
+                for fv in itertools.chain(
+                    self._list_feature_views(hide_dummy_entity=False),
+                    self._list_stream_feature_views(hide_dummy_entity=False),
+                )
+            }
             for name in feature_views:
-                try:
-                    feature_view = self._get_feature_view(name, hide_dummy_entity=False)
-                except FeatureViewNotFoundException:
-                    feature_view = self._get_stream_feature_view(
-                        name, hide_dummy_entity=False
-                    )
+                feature_view = feature_views_by_name.get(name)
+                if feature_view is None:
+                    raise FeatureViewNotFoundException(name, self.project)
 
                 if not feature_view.online:
                     raise ValueError(
@@ -714,7 +880,10 @@ class FeatureStore:
         # Compute the desired difference between the current infra, as stored in the registry,
         # and the desired infra.
         self._registry.refresh(self.project)
-        current_infra_proto = self._registry.proto().infra.__deepcopy__()
+        # CopyFrom clones the message natively in the protobuf backend, which is much
+        # faster than deepcopy's Python-level reflection for large registries.
+        current_infra_proto = InfraProto()
+        current_infra_proto.CopyFrom(self._registry.proto().infra)
         desired_registry_proto = desired_repo_contents.to_registry_proto()
         new_infra = self._provider.plan_infra(self.config, desired_registry_proto)
         new_infra_proto = new_infra.to_proto()
@@ -795,83 +964,129 @@ class FeatureStore:
             >>> fs.apply([driver_hourly_stats_view, driver]) # register entity and feature view
         """
         # TODO: Add locking
-        if not isinstance(objects, Iterable):
-            objects = [objects]
-        assert isinstance(objects, list)
+        # Check for a list first; isinstance against the Iterable ABC walks
+        # __subclasshook__ and is much slower than a plain type check.
+        if not isinstance(objects, list):
+            objects = list(objects) if isinstance(objects, Iterable) else [objects]
 
         if not objects_to_delete:
             objects_to_delete = []
 
-        # Separate all objects into entities, feature services, and different feature view types.
-        entities_to_update = [ob for ob in objects if isinstance(ob, Entity)]
-        views_to_update = [
-            ob
-            for ob in objects
-            if (
-                isinstance(ob, FeatureView)
-                and not isinstance(ob, StreamFeatureView)
-                and not isinstance(ob, BatchFeatureView)
-            )
-        ]
-        sfvs_to_update = [ob for ob in objects if isinstance(ob, StreamFeatureView)]
-        request_views_to_update = [
-            ob for ob in objects if isinstance(ob, RequestFeatureView)
-        ]
-        odfvs_to_update = [ob for ob in objects if isinstance(ob, OnDemandFeatureView)]
-        services_to_update = [ob for ob in objects if isinstance(ob, FeatureService)]
-        data_sources_set_to_update = {
-            ob for ob in objects if isinstance(ob, DataSource)
-        }
-        validation_references_to_update = [
-            ob for ob in objects if isinstance(ob, ValidationReference)
-        ]
-
-        for fv in itertools.chain(views_to_update, sfvs_to_update):
-            data_sources_set_to_update.add(fv.batch_source)
-            if fv.stream_source:
-                data_sources_set_to_update.add(fv.stream_source)
+        # Separate all objects into entities, feature services, and different feature
+        # view types with a single pass over the objects, dispatching each object to
+        # its bucket by type instead of re-scanning the full list per category. Data
+        # sources referenced by the feature views are collected in the same pass,
+        # deduplicated by object identity to avoid hashing data source protos.
+        entities_to_update: List[Entity] = []
+        views_to_update: List[FeatureView] = []
+        sfvs_to_update: List[StreamFeatureView] = []
+        request_views_to_update: List[RequestFeatureView] = []
+        odfvs_to_update: List[OnDemandFeatureView] = []
+        services_to_update: List[FeatureService] = []
+        data_sources_to_update_map: Dict[int, DataSource] = {}
+        validation_references_to_update: List[ValidationReference] = []
+
+        for ob in objects:
+            if isinstance(ob, Entity):
+                entities_to_update.append(ob)
+            elif isinstance(ob, StreamFeatureView):
+                sfvs_to_update.append(ob)
+                data_sources_to_update_map.setdefault(
+                    id(ob.batch_source), ob.batch_source
+                )
+                if ob.stream_source:
+                    data_sources_to_update_map.setdefault(
+                        id(ob.stream_source), ob.stream_source
+                    )
+            elif isinstance(ob, FeatureView):
+                if not isinstance(ob, BatchFeatureView):
+                    views_to_update.append(ob)
+                    data_sources_to_update_map.setdefault(
+                        id(ob.batch_source), ob.batch_source
+                    )
+                    if ob.stream_source:
+                        data_sources_to_update_map.setdefault(
+                            id(ob.stream_source), ob.stream_source
+                        )
+            elif isinstance(ob, OnDemandFeatureView):
+                odfvs_to_update.append(ob)
+                for v in ob.source_request_sources.values():
+                    data_sources_to_update_map.setdefault(id(v), v)
+            elif isinstance(ob, RequestFeatureView):
+                request_views_to_update.append(ob)
+                data_sources_to_update_map.setdefault(
+                    id(ob.request_data_source), ob.request_data_source
+                )
+            elif isinstance(ob, FeatureService):
+                services_to_update.append(ob)
+            elif isinstance(ob, DataSource):
+                data_sources_to_update_map.setdefault(id(ob), ob)
+            elif isinstance(ob, ValidationReference):
+                validation_references_to_update.append(ob)
 
         if request_views_to_update:
-            warnings.warn(
+            _warn_once(
                 "Request feature view is deprecated. "
                 "Please use request data source instead",
                 DeprecationWarning,
             )
 
-        for rfv in request_views_to_update:
-            data_sources_set_to_update.add(rfv.request_data_source)
-
-        for odfv in odfvs_to_update:
-            for v in odfv.source_request_sources.values():
-                data_sources_set_to_update.add(v)
-
-        data_sources_to_update = list(data_sources_set_to_update)
-
-        # Handle all entityless feature views by using DUMMY_ENTITY as a placeholder entity.
-        entities_to_update.append(DUMMY_ENTITY)
+        data_sources_to_update = list(data_sources_to_update_map.values())
+
+        # Handle all entityless feature views by using DUMMY_ENTITY as a placeholder
+        # entity. Rebind rather than append so the list built from the caller's
+        # objects is left untouched and repeated apply() calls stay idempotent.
+        if not any(entity is DUMMY_ENTITY for entity in entities_to_update):
+            entities_to_update = [*entities_to_update, DUMMY_ENTITY]
+
+        # Validate all feature views and make inferences. Both passes are no-ops
+        # without feature views (resp. data sources or services), so skip them for
+        # applies that only touch other object types.
+        if (
+            views_to_update
+            or odfvs_to_update
+            or request_views_to_update
+            or sfvs_to_update
+        ):
+            self._validate_all_feature_views(
+                views_to_update,
+                odfvs_to_update,
+                request_views_to_update,
+                sfvs_to_update,
+            )
+        if (
+            data_sources_to_update
+            or views_to_update
+            or odfvs_to_update
+            or sfvs_to_update
+            or services_to_update
+        ):
+            self._make_inferences(
+                data_sources_to_update,
+                entities_to_update,
+                views_to_update,
+                odfvs_to_update,
+                sfvs_to_update,
+                services_to_update,
+            )
 
-        # Validate all feature views and make inferences.
-        self._validate_all_feature_views(
-            views_to_update, odfvs_to_update, request_views_to_update, sfvs_to_update
+        # Add all objects to the registry and update the provider's infrastructure.
+        self._registry.apply_data_sources(
+            data_sources_to_update, project=self.project, commit=False
         )
-        self._make_inferences(
-            data_sources_to_update,
-            entities_to_update,
-            views_to_update,
-            odfvs_to_update,
-            sfvs_to_update,
-            services_to_update,
+        self._registry.apply_feature_views(
+            itertools.chain(
+                views_to_update,
+                odfvs_to_update,
+                request_views_to_update,
+                sfvs_to_update,
+            ),
+            project=self.project,
+            commit=False,
+        )
+        self._registry.apply_entities(
+            entities_to_update, project=self.project, commit=False
         )
-
-        # Add all objects to the registry and update the provider's infrastructure.
-        for ds in data_sources_to_update:
-            self._registry.apply_data_source(ds, project=self.project, commit=False)
-        for view in itertools.chain(
-            views_to_update, odfvs_to_update, request_views_to_update, sfvs_to_update
-        ):
-            self._registry.apply_feature_view(view, project=self.project, commit=False)
-        for ent in entities_to_update:
-            self._registry.apply_entity(ent, project=self.project, commit=False)
         for feature_service in services_to_update:
             self._registry.apply_feature_service(
                 feature_service, project=self.project, commit=False
@@ -882,69 +1097,69 @@ class FeatureStore:
             )
 
         if not partial:
-            # Delete all registry objects that should not exist.
-            entities_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, Entity)
-            ]
-            views_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, FeatureView)
-            ]
-            request_views_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, RequestFeatureView)
-            ]
-            odfvs_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, OnDemandFeatureView)
-            ]
-            sfvs_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, StreamFeatureView)
-            ]
-            services_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, FeatureService)
-            ]
-            data_sources_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, DataSource)
-            ]
-            validation_references_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, ValidationReference)
-            ]
-
-            for data_source in data_sources_to_delete:
-                self._registry.delete_data_source(
-                    data_source.name, project=self.project, commit=False
-                )
-            for entity in entities_to_delete:
-                self._registry.delete_entity(
-                    entity.name, project=self.project, commit=False
-                )
-            for view in views_to_delete:
-                self._registry.delete_feature_view(
-                    view.name, project=self.project, commit=False
-                )
-            for request_view in request_views_to_delete:
-                self._registry.delete_feature_view(
-                    request_view.name, project=self.project, commit=False
-                )
-            for odfv in odfvs_to_delete:
-                self._registry.delete_feature_view(
-                    odfv.name, project=self.project, commit=False
-                )
-            for sfv in sfvs_to_delete:
-                self._registry.delete_feature_view(
-                    sfv.name, project=self.project, commit=False
-                )
-            for service in services_to_delete:
-                self._registry.delete_feature_service(
-                    service.name, project=self.project, commit=False
-                )
-            for validation_references in validation_references_to_delete:
-                self._registry.delete_validation_reference(
-                    validation_references.name, project=self.project, commit=False
-                )
+            # Delete all registry objects that should not exist, bucketing the
+            # objects by type in a single pass as above. Note that stream feature
+            # views are also feature views, so they land in both delete lists just
+            # as they did with the per-type comprehensions.
+            entities_to_delete: List[Entity] = []
+            views_to_delete: List[FeatureView] = []
+            sfvs_to_delete: List[StreamFeatureView] = []
+            request_views_to_delete: List[RequestFeatureView] = []
+            odfvs_to_delete: List[OnDemandFeatureView] = []
+            services_to_delete: List[FeatureService] = []
+            data_sources_to_delete: List[DataSource] = []
+            validation_references_to_delete: List[ValidationReference] = []
+
+            for ob in objects_to_delete:
+                if isinstance(ob, Entity):
+                    entities_to_delete.append(ob)
+                elif isinstance(ob, FeatureView):
+                    views_to_delete.append(ob)
+                    if isinstance(ob, StreamFeatureView):
+                        sfvs_to_delete.append(ob)
+                elif isinstance(ob, OnDemandFeatureView):
+                    odfvs_to_delete.append(ob)
+                elif isinstance(ob, RequestFeatureView):
+                    request_views_to_delete.append(ob)
+                elif isinstance(ob, FeatureService):
+                    services_to_delete.append(ob)
+                elif isinstance(ob, DataSource):
+                    data_sources_to_delete.append(ob)
+                elif isinstance(ob, ValidationReference):
+                    validation_references_to_delete.append(ob)
+
+            # Dispatch the remaining per-type deletes through one table so the
+            # bound registry method is resolved once per type, not per object.
+            deletes: Tuple[Tuple[Sequence[FeastObject], Callable], ...] = (
+                (data_sources_to_delete, self._registry.delete_data_source),
+                (entities_to_delete, self._registry.delete_entity),
+                (services_to_delete, self._registry.delete_feature_service),
+                (
+                    validation_references_to_delete,
+                    self._registry.delete_validation_reference,
+                ),
+            )
+            for objs, delete_fn in deletes:
+                for ob in objs:
+                    delete_fn(ob.name, project=self.project, commit=False)
+            self._registry.delete_feature_views(
+                (
+                    view.name
+                    for view in itertools.chain(
+                        views_to_delete,
+                        request_views_to_delete,
+                        odfvs_to_delete,
+                        sfvs_to_delete,
+                    )
+                ),
+                project=self.project,
+                commit=False,
+            )
 
         self._get_provider().update_infra(
             project=self.project,
-            tables_to_delete=views_to_delete + sfvs_to_delete if not partial else [],
-            tables_to_keep=views_to_update + sfvs_to_update,
+            tables_to_delete=[*views_to_delete, *sfvs_to_delete] if not partial else [],
+            tables_to_keep=[*views_to_update, *sfvs_to_update],
             entities_to_delete=entities_to_delete if not partial else [],
             entities_to_keep=entities_to_update,
             partial=partial,
@@ -952,6 +1167,15 @@ class FeatureStore:
 
         self._registry.commit()
 
+        # Feature services and feature views may have changed, so any cached
+        # derivations of them are stale.
+        self._feature_service_refs_cache.clear()
+        self._feature_views_to_use_cache.clear()
+        self._push_source_index_cache = None
+        self._entity_maps_cache.clear()
+        self._saved_dataset_cache.clear()
+        self._validation_reference_cache.clear()
+
         # go server needs to be reloaded to apply new configuration.
         # we're stopping it here
         # new server will be instantiated on the next online request
@@ -969,6 +1193,12 @@ class FeatureStore:
 
         self._get_provider().teardown_infra(self.project, tables, entities)
         self._registry.teardown()
+        self._feature_service_refs_cache.clear()
+        self._feature_views_to_use_cache.clear()
+        self._push_source_index_cache = None
+        self._entity_maps_cache.clear()
+        self._saved_dataset_cache.clear()
+        self._validation_reference_cache.clear()
         self._teardown_go_server()
 
     @log_exceptions_and_usage
@@ -1034,6 +1264,8 @@ class FeatureStore:
             ... )
             >>> feature_data = retrieval_job.to_df()
         """
+        import pandas as pd
+
         _feature_refs = self._get_features(features)
         (
             all_feature_views,
@@ -1042,7 +1274,7 @@ class FeatureStore:
         ) = self._get_feature_views_to_use(features)
 
         if all_request_feature_views:
-            warnings.warn(
+            _warn_once(
                 "Request feature view is deprecated. "
                 "Please use request data source instead",
                 DeprecationWarning,
@@ -1056,6 +1288,7 @@ class FeatureStore:
             all_feature_views,
             all_request_feature_views,
             all_on_demand_feature_views,
+            full_feature_names=full_feature_names,
         )
         feature_views = list(view for view, _ in fvs)
         on_demand_feature_views = list(view for view, _ in odfvs)
@@ -1065,27 +1298,29 @@ class FeatureStore:
         set_usage_attribute("request_fv", bool(request_feature_views))
 
         # Check that the right request data is present in the entity_df
-        if type(entity_df) == pd.DataFrame:
-            entity_df = utils.make_df_tzaware(cast(pd.DataFrame, entity_df))
+        if isinstance(entity_df, pd.DataFrame):
+            entity_df = utils.make_df_tzaware(entity_df)
+            # Membership checks against a pandas Index re-walk the Index; hash the
+            # column names once instead.
+            entity_df_columns = set(entity_df.columns)
             for fv in request_feature_views:
                 for feature in fv.features:
-                    if feature.name not in entity_df.columns:
+                    if feature.name not in entity_df_columns:
                         raise RequestDataNotFoundInEntityDfException(
                             feature_name=feature.name, feature_view_name=fv.name
                         )
             for odfv in on_demand_feature_views:
-                odfv_request_data_schema = odfv.get_request_data_schema()
-                for feature_name in odfv_request_data_schema.keys():
-                    if feature_name not in entity_df.columns:
+                for feature_name in odfv.get_request_data_schema():
+                    if feature_name not in entity_df_columns:
                         raise RequestDataNotFoundInEntityDfException(
                             feature_name=feature_name,
                             feature_view_name=odfv.name,
                         )
 
-        _validate_feature_refs(_feature_refs, full_feature_names)
         # Drop refs that refer to RequestFeatureViews since they don't need to be fetched and
         # already exist in the entity_df
-        _feature_refs = [ref for ref in _feature_refs if ref not in request_fv_refs]
+        if request_fv_refs:
+            _feature_refs = [ref for ref in _feature_refs if ref not in request_fv_refs]
         provider = self._get_provider()
 
         job = provider.get_historical_features(
@@ -1122,7 +1357,7 @@ class FeatureStore:
         Raises:
             ValueError if given retrieval job doesn't have metadata
         """
-        warnings.warn(
+        _warn_once(
             "Saving dataset is an experimental feature. "
             "This API is unstable and it could and most probably will be changed in the future. "
             "We do not guarantee that future changes will maintain backward compatibility.",
@@ -1174,20 +1409,29 @@ class FeatureStore:
         Raises:
             SavedDatasetNotFound
         """
-        warnings.warn(
+        _warn_once(
             "Retrieving datasets is an experimental feature. "
             "This API is unstable and it could and most probably will be changed in the future. "
             "We do not guarantee that future changes will maintain backward compatibility.",
             RuntimeWarning,
         )
 
+        cached = self._saved_dataset_cache.get(name)
+        if cached is not None:
+            dataset, cached_at = cached
+            ttl = self._registry_config.cache_ttl_seconds
+            if ttl <= 0 or time.monotonic() - cached_at < ttl:
+                return dataset
+
         dataset = self._registry.get_saved_dataset(name, self.project)
         provider = self._get_provider()
 
         retrieval_job = provider.retrieve_saved_dataset(
             config=self.config, dataset=dataset
         )
-        return dataset.with_retrieval_job(retrieval_job)
+        dataset = dataset.with_retrieval_job(retrieval_job)
+        self._saved_dataset_cache[name] = (dataset, time.monotonic())
+        return dataset
 
     @log_exceptions_and_usage
     def materialize_incremental(
@@ -1223,6 +1467,8 @@ class FeatureStore:
             <BLANKLINE>
             ...
         """
+        from colorama import Fore, Style
+
         feature_views_to_materialize = self._get_feature_views_to_materialize(
             feature_views
         )
@@ -1232,7 +1478,11 @@ class FeatureStore:
             len(feature_views_to_materialize),
             self.config.online_store.type,
         )
+        provider = self._get_provider()
+        end_date = utils.make_tzaware(end_date)
+
         # TODO paging large loads
+        views_with_ranges: List[Tuple[FeatureView, datetime, datetime]] = []
         for feature_view in feature_views_to_materialize:
             start_date = feature_view.most_recent_end_time
             if start_date is None:
@@ -1251,35 +1501,18 @@ class FeatureStore:
                         "the start date will be set to 1 year before the current time."
                     )
                     start_date = datetime.utcnow() - timedelta(weeks=52)
-            provider = self._get_provider()
             print(
                 f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}"
                 f" from {Style.BRIGHT + Fore.GREEN}{start_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}"
                 f" to {Style.BRIGHT + Fore.GREEN}{end_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}:"
             )
 
-            def tqdm_builder(length):
-                return tqdm(total=length, ncols=100)
-
             start_date = utils.make_tzaware(start_date)
-            end_date = utils.make_tzaware(end_date)
-
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
-            )
+            views_with_ranges.append((feature_view, start_date, end_date))
 
-            self._registry.apply_materialization(
-                feature_view,
-                self.project,
-                start_date,
-                end_date,
-            )
+        self._materialize_feature_views(
+            provider, views_with_ranges, _default_tqdm_builder
+        )
 
     @log_exceptions_and_usage
     def materialize(
@@ -1314,6 +1547,8 @@ class FeatureStore:
             <BLANKLINE>
             ...
         """
+        from colorama import Fore, Style
+
         if utils.make_tzaware(start_date) > utils.make_tzaware(end_date):
             raise ValueError(
                 f"The given start_date {start_date} is greater than the given end_date {end_date}."
@@ -1328,33 +1563,80 @@ class FeatureStore:
             len(feature_views_to_materialize),
             self.config.online_store.type,
         )
+        provider = self._get_provider()
+        start_date = utils.make_tzaware(start_date)
+        end_date = utils.make_tzaware(end_date)
+
         # TODO paging large loads
         for feature_view in feature_views_to_materialize:
-            provider = self._get_provider()
             print(f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}:")
 
-            def tqdm_builder(length):
-                return tqdm(total=length, ncols=100)
-
-            start_date = utils.make_tzaware(start_date)
-            end_date = utils.make_tzaware(end_date)
+        self._materialize_feature_views(
+            provider,
+            [
+                (feature_view, start_date, end_date)
+                for feature_view in feature_views_to_materialize
+            ],
+            _default_tqdm_builder,
+        )
 
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
-            )
+    def _materialize_feature_views(
+        self,
+        provider: Provider,
+        views_with_ranges: List[Tuple[FeatureView, datetime, datetime]],
+        tqdm_builder: Callable,
+    ) -> None:
+        """Materializes feature views over their respective time ranges.
+
+        When `materialization_max_workers` is greater than one, the per-view provider
+        calls run concurrently in a thread pool; they are independent and I/O-bound.
+        Materialization records are always written to the registry from the calling
+        thread, since registry implementations are not guaranteed to be thread-safe.
+        """
+        max_workers = self.config.materialization_max_workers
+        if max_workers > 1 and len(views_with_ranges) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        provider.materialize_single_feature_view,
+                        config=self.config,
+                        feature_view=feature_view,
+                        start_date=start_date,
+                        end_date=end_date,
+                        registry=self._registry,
+                        project=self.project,
+                        tqdm_builder=tqdm_builder,
+                    )
+                    for feature_view, start_date, end_date in views_with_ranges
+                ]
+                for (feature_view, start_date, end_date), future in zip(
+                    views_with_ranges, futures
+                ):
+                    future.result()
+                    self._registry.apply_materialization(
+                        feature_view,
+                        self.project,
+                        start_date,
+                        end_date,
+                    )
+        else:
+            for feature_view, start_date, end_date in views_with_ranges:
+                provider.materialize_single_feature_view(
+                    config=self.config,
+                    feature_view=feature_view,
+                    start_date=start_date,
+                    end_date=end_date,
+                    registry=self._registry,
+                    project=self.project,
+                    tqdm_builder=tqdm_builder,
+                )
 
-            self._registry.apply_materialization(
-                feature_view,
-                self.project,
-                start_date,
-                end_date,
-            )
+                self._registry.apply_materialization(
+                    feature_view,
+                    self.project,
+                    start_date,
+                    end_date,
+                )
 
     @log_exceptions_and_usage
     def push(
@@ -1373,36 +1655,68 @@ class FeatureStore:
             allow_registry_cache: Whether to allow cached versions of the registry.
             to: Whether to push to online or offline store. Defaults to online store only.
         """
-        warnings.warn(
+        _warn_once(
             "Push source is an experimental feature. "
             "This API is unstable and it could and might change in the future. "
             "We do not guarantee that future changes will maintain backward compatibility.",
             RuntimeWarning,
         )
-        from feast.data_source import PushSource
-
-        all_fvs = self.list_feature_views(allow_cache=allow_registry_cache)
-        all_fvs += self.list_stream_feature_views(allow_cache=allow_registry_cache)
-
-        fvs_with_push_sources = {
-            fv
-            for fv in all_fvs
-            if (
-                fv.stream_source is not None
-                and isinstance(fv.stream_source, PushSource)
-                and fv.stream_source.name == push_source_name
-            )
-        }
+        fvs_with_push_sources = self._get_push_source_index(allow_registry_cache).get(
+            push_source_name, []
+        )
 
+        # The index already holds resolved feature view objects, so ingest them
+        # directly instead of re-resolving each one by name through the registry.
         for fv in fvs_with_push_sources:
             if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
-                self.write_to_online_store(
-                    fv.name, df, allow_registry_cache=allow_registry_cache
+                self._write_df_to_online_store(
+                    fv, df, allow_registry_cache=allow_registry_cache
                 )
             if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
-                self.write_to_offline_store(
-                    fv.name, df, allow_registry_cache=allow_registry_cache
-                )
+                self._write_df_to_offline_store(fv, df)
+
+    def _get_push_source_index(
+        self, allow_registry_cache: bool
+    ) -> Dict[str, List[FeatureView]]:
+        """Returns a mapping from push source name to the feature views fed by it.
+
+        push() is typically called once per event, so scanning every feature view
+        on each call is wasteful; the index is memoized with the registry cache
+        TTL and invalidated whenever the registry is updated.
+        """
+        if allow_registry_cache and self._push_source_index_cache is not None:
+            index, cached_at = self._push_source_index_cache
+            ttl = self._registry_config.cache_ttl_seconds
+            if ttl <= 0 or time.monotonic() - cached_at < ttl:
+                return index
+
+        from feast.data_source import PushSource
+
+        index = defaultdict(list)
+        for fv in itertools.chain(
+            self.list_feature_views(allow_cache=allow_registry_cache),
+            self.list_stream_feature_views(allow_cache=allow_registry_cache),
+        ):
+            if isinstance(fv.stream_source, PushSource):
+                index[fv.stream_source.name].append(fv)
+        index = dict(index)
+
+        if allow_registry_cache:
+            self._push_source_index_cache = (index, time.monotonic())
+        return index
+
+    def _resolve_feature_view(
+        self, feature_view_name: str, allow_registry_cache: bool
+    ) -> FeatureView:
+        """Fetches a stream or batch feature view by name from the registry."""
+        try:
+            return self.get_stream_feature_view(
+                feature_view_name, allow_registry_cache=allow_registry_cache
+            )
+        except FeatureViewNotFoundException:
+            return self.get_feature_view(
+                feature_view_name, allow_registry_cache=allow_registry_cache
+            )
 
     @log_exceptions_and_usage
     def write_to_online_store(
@@ -1415,19 +1729,29 @@ class FeatureStore:
         ingests data directly into the Online store
         """
         # TODO: restrict this to work with online StreamFeatureViews and validate the FeatureView type
-        try:
-            feature_view = self.get_stream_feature_view(
-                feature_view_name, allow_registry_cache=allow_registry_cache
-            )
-        except FeatureViewNotFoundException:
-            feature_view = self.get_feature_view(
-                feature_view_name, allow_registry_cache=allow_registry_cache
-            )
-        entities = []
-        for entity_name in feature_view.entities:
-            entities.append(
-                self.get_entity(entity_name, allow_registry_cache=allow_registry_cache)
+        feature_view = self._resolve_feature_view(
+            feature_view_name, allow_registry_cache
+        )
+        self._write_df_to_online_store(feature_view, df, allow_registry_cache)
+
+    def _write_df_to_online_store(
+        self,
+        feature_view: FeatureView,
+        df: pd.DataFrame,
+        allow_registry_cache: bool = True,
+    ):
+        """Ingests a dataframe for an already resolved feature view."""
+        # Resolve all entities with one registry listing instead of a scan per name.
+        entity_map = {
+            entity.name: entity
+            for entity in self._list_entities(
+                allow_cache=allow_registry_cache, hide_dummy_entity=False
             )
+        }
+        try:
+            entities = [entity_map[name] for name in feature_view.entities]
+        except KeyError as e:
+            raise EntityNotFoundException(e.args[0], self.project) from e
         provider = self._get_provider()
         provider.ingest_df(feature_view, entities, df)
 
@@ -1446,18 +1770,26 @@ class FeatureStore:
         reorders the columns of the dataframe to match.
         """
         # TODO: restrict this to work with online StreamFeatureViews and validate the FeatureView type
-        try:
-            feature_view = self.get_stream_feature_view(
-                feature_view_name, allow_registry_cache=allow_registry_cache
-            )
-        except FeatureViewNotFoundException:
-            feature_view = self.get_feature_view(
-                feature_view_name, allow_registry_cache=allow_registry_cache
-            )
+        feature_view = self._resolve_feature_view(
+            feature_view_name, allow_registry_cache
+        )
+        self._write_df_to_offline_store(feature_view, df, reorder_columns)
 
-        # Get columns of the batch source and the input dataframe.
-        column_names_and_types = (
-            feature_view.batch_source.get_table_column_names_and_types(self.config)
+    def _write_df_to_offline_store(
+        self,
+        feature_view: FeatureView,
+        df: pd.DataFrame,
+        reorder_columns: bool = True,
+    ):
+        """Ingests a dataframe into the batch source of an already resolved feature view."""
+        import pyarrow as pa
+
+        # Get columns of the batch source and the input dataframe. Describing the
+        # table can be a network round-trip for warehouse sources, so the cached
+        # variant memoizes the result on the source object.
+        batch_source = feature_view.batch_source
+        column_names_and_types = batch_source.get_table_column_names_and_types_cached(
+            self.config
         )
         source_columns = [column for column, _ in column_names_and_types]
         input_columns = df.columns.values.tolist()
@@ -1467,10 +1799,33 @@ class FeatureStore:
                 f"The input dataframe has columns {set(input_columns)} but the batch source has columns {set(source_columns)}."
             )
 
-        if reorder_columns:
-            df = df.reindex(columns=source_columns)
-
-        table = pa.Table.from_pandas(df)
+        # Build the Arrow table column by column in the desired order. This avoids
+        # the intermediate DataFrame copy a reindex would make, and lets Arrow
+        # zero-copy numeric columns instead of converting the whole frame at once.
+        # Each column is converted in a single pa.array call so its type is
+        # inferred from the whole column (per-slice inference can disagree
+        # across slices, e.g. an all-null slice of a string column infers
+        # null). Large columns are then split into zero-copy slices so table
+        # chunks stay bounded for downstream consumers.
+        columns = source_columns if reorder_columns else input_columns
+        num_rows = len(df)
+        if num_rows <= _OFFLINE_WRITE_BATCH_ROWS:
+            arrays: List[Union[pa.Array, pa.ChunkedArray]] = [
+                pa.array(df[column], from_pandas=True) for column in columns
+            ]
+        else:
+            arrays = []
+            for column in columns:
+                whole_column = pa.array(df[column], from_pandas=True)
+                arrays.append(
+                    pa.chunked_array(
+                        [
+                            whole_column.slice(i, _OFFLINE_WRITE_BATCH_ROWS)
+                            for i in range(0, num_rows, _OFFLINE_WRITE_BATCH_ROWS)
+                        ]
+                    )
+                )
+        table = pa.Table.from_arrays(arrays, names=columns)
         provider = self._get_provider()
         provider.ingest_df_to_offline_store(feature_view, table)
 
@@ -1522,13 +1877,14 @@ class FeatureStore:
             ... )
             >>> online_response_dict = online_response.to_dict()
         """
-        columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
-        for entity_row in entity_rows:
-            for key, value in entity_row.items():
-                try:
-                    columnar[key].append(value)
-                except KeyError as e:
-                    raise ValueError("All entity_rows must have the same keys.") from e
+        # Validate the keys once up front, then build each column with a tight
+        # list comprehension instead of a per-cell loop with exception handling.
+        keys = entity_rows[0].keys()
+        if any(entity_row.keys() != keys for entity_row in entity_rows):
+            raise ValueError("All entity_rows must have the same keys.")
+        columnar: Dict[str, List[Any]] = {
+            key: [entity_row[key] for entity_row in entity_rows] for key in keys
+        }
 
         return self._get_online_features(
             features=features,
@@ -1543,11 +1899,24 @@ class FeatureStore:
             EmbeddedOnlineFeatureServer,
         )
 
-        # Lazily start the go server on the first request
-        if self._go_server is None:
-            self._go_server = EmbeddedOnlineFeatureServer(
-                str(self.repo_path.absolute()), self.config, self
-            )
+        # Lazily start the go server on the first request. The lock makes the
+        # check-and-create atomic, so a request arriving while the background
+        # warm-up thread started in __init__ is still booting the server waits
+        # for that server instead of spawning a second one.
+        with self._go_server_lock:
+            if self._go_server is None:
+                self._go_server = EmbeddedOnlineFeatureServer(
+                    str(self.repo_path.absolute()), self.config, self
+                )
+
+    def _warm_up_go_server(self):
+        try:
+            self._lazy_init_go_server()
+        except Exception:
+            # Warm-up is best effort; initialization errors are re-raised with
+            # full context on the first serving call, which retries the init,
+            # rather than dying silently in a daemon thread.
+            pass
 
     def _get_online_features(
         self,
@@ -1558,13 +1927,9 @@ class FeatureStore:
         full_feature_names: bool = False,
         native_entity_values: bool = True,
     ):
-        # Extract Sequence from RepeatedValue Protobuf.
-        entity_value_lists: Dict[str, Union[List[Any], List[Value]]] = {
-            k: list(v) if isinstance(v, Sequence) else list(v.val)
-            for k, v in entity_values.items()
-        }
-
-        # If the embedded Go code is enabled, send request to it instead of going through regular Python logic.
+        # If the embedded Go code is enabled, send request to it instead of going
+        # through regular Python logic. The columns are handed over directly so
+        # the hot path does not materialize intermediate Python lists first.
         if self.config.go_feature_retrieval:
             self._lazy_init_go_server()
 
@@ -1576,12 +1941,15 @@ class FeatureStore:
                 entity_native_values = {
                     k: [
                         feast_value_type_to_python_type(proto_value)
-                        for proto_value in v
+                        for proto_value in (v if isinstance(v, Sequence) else v.val)
                     ]
-                    for k, v in entity_value_lists.items()
+                    for k, v in entity_values.items()
                 }
             else:
-                entity_native_values = entity_value_lists
+                entity_native_values = {
+                    k: v if isinstance(v, list) else list(v)
+                    for k, v in entity_values.items()
+                }
 
             return self._go_server.get_online_features(
                 features_refs=features if isinstance(features, list) else [],
@@ -1593,6 +1961,27 @@ class FeatureStore:
                 full_feature_names=full_feature_names,
             )
 
+        # Extract Sequence from RepeatedValue Protobuf. Lists and numpy arrays
+        # are taken as-is instead of copied element by element; downstream
+        # converters only read from the columns, and keeping ndarrays intact
+        # preserves their contiguous buffer for the vectorized paths. The
+        # public get_online_features path always passes a dict of lists, so it
+        # skips even the dict rebuild.
+        entity_value_lists: Mapping[str, Union[List[Any], List[Value]]]
+        if native_entity_values and all(
+            type(v) is list for v in entity_values.values()
+        ):
+            entity_value_lists = cast(
+                Mapping[str, Union[List[Any], List[Value]]], entity_values
+            )
+        else:
+            entity_value_lists = {
+                k: v
+                if isinstance(v, (list, np.ndarray))
+                else (list(v) if isinstance(v, Sequence) else list(v.val))
+                for k, v in entity_values.items()
+            }
+
         _feature_refs = self._get_features(features, allow_cache=True)
         (
             requested_feature_views,
@@ -1603,7 +1992,7 @@ class FeatureStore:
         )
 
         if requested_request_feature_views:
-            warnings.warn(
+            _warn_once(
                 "Request feature view is deprecated. "
                 "Please use request data source instead",
                 DeprecationWarning,
@@ -1625,10 +2014,10 @@ class FeatureStore:
                 for k, v in entity_value_lists.items()
             }
         else:
-            entity_proto_values = entity_value_lists
+            # The caller passed proto values, so every column is a List[Value].
+            entity_proto_values = cast(Dict[str, List[Value]], entity_value_lists)
 
         num_rows = _validate_entity_values(entity_proto_values)
-        _validate_feature_refs(_feature_refs, full_feature_names)
         (
             grouped_refs,
             grouped_odfv_refs,
@@ -1639,6 +2028,7 @@ class FeatureStore:
             requested_feature_views,
             requested_request_feature_views,
             requested_on_demand_feature_views,
+            full_feature_names=full_feature_names,
         )
         set_usage_attribute("odfv", bool(grouped_odfv_refs))
         set_usage_attribute("request_fv", bool(grouped_request_fv_refs))
@@ -1714,18 +2104,30 @@ class FeatureStore:
                 [DUMMY_ENTITY_VAL] * num_rows, DUMMY_ENTITY.value_type
             )
 
-        provider = self._get_provider()
+        provider = self._provider
+        native_values_cache: Dict[int, List[Any]] = {}
+        unique_entities_cache: Dict[
+            Tuple[Tuple[str, ...], Tuple[int, ...]],
+            Tuple[
+                Tuple[str, ...],
+                Tuple[Tuple[Value, ...], ...],
+                Tuple[List[int], ...],
+            ],
+        ] = {}
         for table, requested_features in grouped_refs:
             # Get the correct set of entity values with the correct join keys.
-            table_entity_values, idxs = self._get_unique_entities(
+            table_join_keys, unique_entity_rows, idxs = self._get_unique_entities(
                 table,
                 join_key_values,
                 entity_name_to_join_key_map,
+                native_values_cache,
+                unique_entities_cache,
             )
 
             # Fetch feature data for the minimum set of Entities.
             feature_data = self._read_from_online_store(
-                table_entity_values,
+                table_join_keys,
+                unique_entity_rows,
                 provider,
                 requested_features,
                 table,
@@ -1749,9 +2151,13 @@ class FeatureStore:
                 full_feature_names,
             )
 
-        self._drop_unneeded_columns(
-            online_features_response, requested_result_row_names
-        )
+        # Unrequested columns only enter the response as odfv inputs (request
+        # data or source feature views); plain retrievals never have anything
+        # to drop, so skip the name-matching pass entirely for them.
+        if grouped_odfv_refs or request_data_features:
+            self._drop_unneeded_columns(
+                online_features_response, requested_result_row_names
+            )
         return OnlineResponse(online_features_response)
 
     @staticmethod
@@ -1777,17 +2183,42 @@ class FeatureStore:
     def _get_entity_maps(
         self, feature_views
     ) -> Tuple[Dict[str, str], Dict[str, ValueType], Set[str]]:
+        # The maps only change when the registry does, so between registry
+        # refreshes they are served from a cache keyed by the feature views of
+        # the request. The maps also depend on each view's projection (feature
+        # services may alias the same view to different join keys), so the key
+        # includes the projection name and join key map, not just the view
+        # name. Callers treat the returned maps as read-only.
+        cache_key = tuple(
+            (
+                feature_view.name,
+                feature_view.projection.name_to_use(),
+                tuple(sorted(feature_view.projection.join_key_map.items())),
+            )
+            for feature_view in feature_views
+        )
+        cached = self._entity_maps_cache.get(cache_key)
+        if cached is not None:
+            entity_maps, cached_at = cached
+            ttl = self._registry_config.cache_ttl_seconds
+            if ttl <= 0 or time.monotonic() - cached_at < ttl:
+                return entity_maps
+
         # TODO(felixwang9817): Support entities that have different types for different feature views.
         entities = self._list_entities(allow_cache=True, hide_dummy_entity=False)
+        entities_by_name = {entity.name: entity for entity in entities}
         entity_name_to_join_key_map: Dict[str, str] = {}
         entity_type_map: Dict[str, ValueType] = {}
         for entity in entities:
             entity_name_to_join_key_map[entity.name] = entity.join_key
         for feature_view in feature_views:
             for entity_name in feature_view.entities:
-                entity = self._registry.get_entity(
-                    entity_name, self.project, allow_cache=True
-                )
+                # The entities were just listed, so resolve from the dict
+                # instead of issuing a registry lookup per entity per view.
+                try:
+                    entity = entities_by_name[entity_name]
+                except KeyError:
+                    raise EntityNotFoundException(entity_name, self.project)
                 # User directly uses join_key as the entity reference in the entity_rows for the
                 # entity mapping case.
                 entity_name = feature_view.projection.join_key_map.get(
@@ -1802,11 +2233,13 @@ class FeatureStore:
                     entity_column.name
                 ] = entity_column.dtype.to_value_type()
 
-        return (
+        entity_maps = (
             entity_name_to_join_key_map,
             entity_type_map,
             set(entity_name_to_join_key_map.values()),
         )
+        self._entity_maps_cache[cache_key] = (entity_maps, time.monotonic())
+        return entity_maps
 
     @staticmethod
     def _get_table_entity_values(
@@ -1837,15 +2270,22 @@ class FeatureStore:
         data: Dict[str, List[Value]],
     ):
         timestamp = Timestamp()  # Only initialize this timestamp once.
+        # Every column covers the same rows, so build the status and timestamp
+        # vectors once and share them across all FeatureVectors instead of
+        # re-materializing a list per column; the proto runtime copies from
+        # them on construction.
+        num_rows = len(next(iter(data.values()), ()))
+        statuses = [FieldStatus.PRESENT] * num_rows
+        event_timestamps = [timestamp] * num_rows
         # Add more values to the existing result rows
         for feature_name, feature_values in data.items():
             online_features_response.metadata.feature_names.val.append(feature_name)
-            online_features_response.results.append(
-                GetOnlineFeaturesResponse.FeatureVector(
-                    values=feature_values,
-                    statuses=[FieldStatus.PRESENT] * len(feature_values),
-                    event_timestamps=[timestamp] * len(feature_values),
-                )
+            # add() constructs the FeatureVector inside the response, avoiding a
+            # temporary message plus the copy that append() would make of it.
+            online_features_response.results.add(
+                values=feature_values,
+                statuses=statuses,
+                event_timestamps=event_timestamps,
             )
 
     @staticmethod
@@ -1888,12 +2328,36 @@ class FeatureStore:
         table: FeatureView,
         join_key_values: Dict[str, List[Value]],
         entity_name_to_join_key_map: Dict[str, str],
-    ) -> Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]:
-        """Return the set of unique composite Entities for a Feature View and the indexes at which they appear.
+        native_values_cache: Optional[Dict[int, List[Any]]] = None,
+        unique_entities_cache: Optional[
+            Dict[
+                Tuple[Tuple[str, ...], Tuple[int, ...]],
+                Tuple[
+                    Tuple[str, ...],
+                    Tuple[Tuple[Value, ...], ...],
+                    Tuple[List[int], ...],
+                ],
+            ]
+        ] = None,
+    ) -> Tuple[
+        Tuple[str, ...], Tuple[Tuple[Value, ...], ...], Tuple[List[int], ...]
+    ]:
+        """Return the join keys, the unique composite Entities for a Feature View, and the indexes at which they appear.
 
         This method allows us to query the OnlineStore for data we need only once
         rather than requesting and processing data for the same combination of
-        Entities multiple times.
+        Entities multiple times. Each unique entity is returned as a tuple of
+        Values aligned with the returned join keys, avoiding a dict allocation
+        per unique entity.
+
+        Args:
+            native_values_cache: Optional cache of native scalars per Value
+                column, keyed by column identity. Feature views commonly share
+                entity columns, so a caller iterating several views can pass the
+                same dict to extract each column's scalars only once.
+            unique_entities_cache: Optional cache of full grouping results,
+                keyed by the resolved join keys and column identities. Views
+                with identical entity sets then share one grouping pass.
         """
         # Get the correct set of entity values with the correct join keys.
         table_entity_values = self._get_table_entity_values(
@@ -1902,49 +2366,97 @@ class FeatureStore:
             join_key_values,
         )
 
-        # Convert back to rowise.
-        keys = table_entity_values.keys()
-        # Sort the rowise data to allow for grouping but keep original index. This lambda is
-        # sufficient as Entity types cannot be complex (ie. lists).
-        rowise = list(enumerate(zip(*table_entity_values.values())))
-        rowise.sort(
-            key=lambda row: tuple(getattr(x, x.WhichOneof("val")) for x in row[1])
-        )
-
-        # Identify unique entities and the indexes at which they occur.
-        unique_entities: Tuple[Dict[str, Value], ...]
-        indexes: Tuple[List[int], ...]
-        unique_entities, indexes = tuple(
-            zip(
-                *[
-                    (dict(zip(keys, k)), [_[0] for _ in g])
-                    for k, g in itertools.groupby(rowise, key=lambda x: x[1])
-                ]
+        cache_key = None
+        if unique_entities_cache is not None:
+            cache_key = (
+                tuple(table_entity_values.keys()),
+                tuple(id(column) for column in table_entity_values.values()),
             )
-        )
-        return unique_entities, indexes
+            cached = unique_entities_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Extract the native scalar from each Value once per column; WhichOneof
+        # reflects into the descriptor and is expensive to call per comparison.
+        # Extracting the scalar is sufficient as Entity types cannot be complex
+        # (ie. lists).
+        native_columns: List[List[Any]] = []
+        for column in table_entity_values.values():
+            natives = (
+                native_values_cache.get(id(column))
+                if native_values_cache is not None
+                else None
+            )
+            if natives is None:
+                natives = [getattr(x, x.WhichOneof("val")) for x in column]
+                if native_values_cache is not None:
+                    native_values_cache[id(column)] = natives
+            native_columns.append(natives)
+
+        # Convert back to rowise and group duplicate entities with one hash-based
+        # pass over the native scalars, rather than sorting rows with a proto
+        # reflection comparison key.
+        join_keys = tuple(table_entity_values.keys())
+        groups: Dict[Any, Tuple[Tuple[Value, ...], List[int]]] = {}
+        if len(native_columns) == 1:
+            # Single join key (the common case): key the dict on the scalar
+            # itself, skipping a tuple allocation and tuple hash per row.
+            for index, (value, group_key) in enumerate(
+                zip(table_entity_values[join_keys[0]], native_columns[0])
+            ):
+                group = groups.get(group_key)
+                if group is None:
+                    groups[group_key] = ((value,), [index])
+                else:
+                    group[1].append(index)
+        else:
+            for index, (row, group_key) in enumerate(
+                zip(zip(*table_entity_values.values()), zip(*native_columns))
+            ):
+                group = groups.get(group_key)
+                if group is None:
+                    groups[group_key] = (row, [index])
+                else:
+                    group[1].append(index)
+
+        unique_entities = tuple(entity for entity, _ in groups.values())
+        indexes = tuple(entity_indexes for _, entity_indexes in groups.values())
+        if unique_entities_cache is not None and cache_key is not None:
+            unique_entities_cache[cache_key] = (join_keys, unique_entities, indexes)
+        return join_keys, unique_entities, indexes
 
     def _read_from_online_store(
         self,
-        entity_rows: Iterable[Mapping[str, Value]],
+        join_keys: Tuple[str, ...],
+        entity_value_rows: Iterable[Tuple[Value, ...]],
         provider: Provider,
         requested_features: List[str],
         table: FeatureView,
-    ) -> List[Tuple[List[Timestamp], List["FieldStatus.ValueType"], List[Value]]]:
+    ) -> Tuple[
+        List[List[Timestamp]], List[List["FieldStatus.ValueType"]], List[List[Value]]
+    ]:
         """Read and process data from the OnlineStore for a given FeatureView.
 
-        This method guarantees that the order of the data in each element of the
-        List returned is the same as the order of `requested_features`.
+        The data is returned pivoted by feature: one (timestamps, statuses,
+        values) column per entry of `requested_features`, in the same order,
+        each covering every entity row. This lets the response be populated
+        feature by feature without transposing row-wise results first.
 
         This method assumes that `provider.online_read` returns data for each
-        combination of Entities in `entity_rows` in the same order as they
+        combination of Entities in `entity_value_rows` in the same order as they
         are provided.
         """
-        # Instantiate one EntityKeyProto per Entity.
-        entity_key_protos = [
-            EntityKeyProto(join_keys=row.keys(), entity_values=row.values())
-            for row in entity_rows
-        ]
+        # Instantiate one EntityKeyProto per Entity. Every row shares the same
+        # join keys, so assemble them once in a template proto and copy it into
+        # each row's proto; only the entity values are extended per row.
+        join_keys_template = EntityKeyProto()
+        join_keys_template.join_keys.extend(join_keys)
+        entity_key_protos = []
+        for row_values in entity_value_rows:
+            entity_key_proto = EntityKeyProto()
+            entity_key_proto.CopyFrom(join_keys_template)
+            entity_key_proto.entity_values.extend(row_values)
+            entity_key_protos.append(entity_key_proto)
 
         # Fetch data for Entities.
         read_rows = provider.online_read(
@@ -1957,37 +2469,42 @@ class FeatureStore:
         # Each row is a set of features for a given entity key. We only need to convert
         # the data to Protobuf once.
         null_value = Value()
-        read_row_protos = []
+        num_features = len(requested_features)
+        timestamp_columns: List[List[Timestamp]] = [[] for _ in range(num_features)]
+        status_columns: List[List["FieldStatus.ValueType"]] = [
+            [] for _ in range(num_features)
+        ]
+        value_columns: List[List[Value]] = [[] for _ in range(num_features)]
         for read_row in read_rows:
             row_ts_proto = Timestamp()
             row_ts, feature_data = read_row
             # TODO (Ly): reuse whatever timestamp if row_ts is None?
             if row_ts is not None:
                 row_ts_proto.FromDatetime(row_ts)
-            event_timestamps = [row_ts_proto] * len(requested_features)
             if feature_data is None:
-                statuses = [FieldStatus.NOT_FOUND] * len(requested_features)
-                values = [null_value] * len(requested_features)
+                for feature_idx in range(num_features):
+                    timestamp_columns[feature_idx].append(row_ts_proto)
+                    status_columns[feature_idx].append(FieldStatus.NOT_FOUND)
+                    value_columns[feature_idx].append(null_value)
             else:
-                statuses = []
-                values = []
-                for feature_name in requested_features:
-                    # Make sure order of data is the same as requested_features.
-                    if feature_name not in feature_data:
-                        statuses.append(FieldStatus.NOT_FOUND)
-                        values.append(null_value)
+                # Make sure order of data is the same as requested_features.
+                for feature_idx, feature_name in enumerate(requested_features):
+                    timestamp_columns[feature_idx].append(row_ts_proto)
+                    value = feature_data.get(feature_name)
+                    if value is None:
+                        status_columns[feature_idx].append(FieldStatus.NOT_FOUND)
+                        value_columns[feature_idx].append(null_value)
                     else:
-                        statuses.append(FieldStatus.PRESENT)
-                        values.append(feature_data[feature_name])
-            read_row_protos.append((event_timestamps, statuses, values))
-        return read_row_protos
+                        status_columns[feature_idx].append(FieldStatus.PRESENT)
+                        value_columns[feature_idx].append(value)
+        return timestamp_columns, status_columns, value_columns
 
     @staticmethod
     def _populate_response_from_feature_data(
-        feature_data: Iterable[
-            Tuple[
-                Iterable[Timestamp], Iterable["FieldStatus.ValueType"], Iterable[Value]
-            ]
+        feature_data: Tuple[
+            List[List[Timestamp]],
+            List[List["FieldStatus.ValueType"]],
+            List[List[Value]],
         ],
         indexes: Iterable[List[int]],
         online_features_response: GetOnlineFeaturesResponse,
@@ -2002,8 +2519,9 @@ class FeatureStore:
         are provided.
 
         Args:
-            feature_data: A list of data in Protobuf form which was retrieved from the OnlineStore.
-            indexes: A list of indexes which should be the same length as `feature_data`. Each list
+            feature_data: Per-feature (timestamps, statuses, values) columns in Protobuf form
+                which were retrieved from the OnlineStore.
+            indexes: A list of indexes with one entry per unique entity row. Each list
                 of indexes corresponds to a set of result rows in `online_features_response`.
             online_features_response: The object to populate.
             full_feature_names: A boolean that provides the option to add the feature view prefixes to the feature names,
@@ -2013,31 +2531,52 @@ class FeatureStore:
                 data in `feature_data`.
             table: The FeatureView that `feature_data` was retrieved from.
         """
-        # Add the feature names to the response.
-        requested_feature_refs = [
-            f"{table.projection.name_to_use()}__{feature_name}"
-            if full_feature_names
-            else feature_name
-            for feature_name in requested_features
-        ]
+        # Add the feature names to the response. The formatted refs are cached on
+        # the view object, since the projection name resolution and string
+        # formatting otherwise repeat identically on every request; cached views
+        # only live until the next registry refresh.
+        requested_features = tuple(requested_features)
+        refs_cache = table._cached_response_refs
+        if refs_cache is None:
+            refs_cache = table._cached_response_refs = {}
+        cache_key = (requested_features, full_feature_names)
+        requested_feature_refs = refs_cache.get(cache_key)
+        if requested_feature_refs is None:
+            requested_feature_refs = [
+                f"{table.projection.name_to_use()}__{feature_name}"
+                if full_feature_names
+                else feature_name
+                for feature_name in requested_features
+            ]
+            refs_cache[cache_key] = requested_feature_refs
         online_features_response.metadata.feature_names.val.extend(
             requested_feature_refs
         )
 
-        timestamps, statuses, values = zip(*feature_data)
-
-        # Populate the result with data fetched from the OnlineStore
-        # which is guaranteed to be aligned with `requested_features`.
-        for (
-            feature_idx,
-            (timestamp_vector, statuses_vector, values_vector),
-        ) in enumerate(zip(zip(*timestamps), zip(*statuses), zip(*values))):
-            online_features_response.results.append(
-                GetOnlineFeaturesResponse.FeatureVector(
-                    values=apply_list_mapping(values_vector, indexes),
-                    statuses=apply_list_mapping(statuses_vector, indexes),
-                    event_timestamps=apply_list_mapping(timestamp_vector, indexes),
-                )
+        timestamps, statuses, values = feature_data
+
+        # The scatter from unique-entity results back to request-row positions is
+        # identical for every vector of this table, so build the permutation once
+        # and apply it as a C-level fancy index instead of a Python loop per vector.
+        indexes = list(indexes)
+        group_sizes = [len(group) for group in indexes]
+        inverse = np.empty(sum(group_sizes), dtype=np.intp)
+        if indexes:
+            inverse[
+                np.concatenate([np.asarray(group, dtype=np.intp) for group in indexes])
+            ] = np.repeat(np.arange(len(indexes), dtype=np.intp), group_sizes)
+
+        # Populate the result with data fetched from the OnlineStore, which is
+        # already pivoted by feature and aligned with `requested_features`.
+        for timestamp_vector, statuses_vector, values_vector in zip(
+            timestamps, statuses, values
+        ):
+            online_features_response.results.add(
+                values=np.asarray(values_vector, dtype=object)[inverse].tolist(),
+                statuses=np.asarray(statuses_vector, dtype=object)[inverse].tolist(),
+                event_timestamps=np.asarray(timestamp_vector, dtype=object)[
+                    inverse
+                ].tolist(),
             )
 
     @staticmethod
@@ -2076,9 +2615,20 @@ class FeatureStore:
                     else feature_name
                 )
 
+        if not odfv_feature_refs:
+            # None of the requested features come from an odfv, so skip the
+            # response-to-DataFrame materialization entirely.
+            return
+
         initial_response = OnlineResponse(online_features_response)
         initial_response_df = initial_response.to_df()
 
+        # All transformed columns cover the same rows, so the status and
+        # timestamp vectors are built once and shared across every column.
+        num_rows = len(initial_response_df.index)
+        statuses = [FieldStatus.PRESENT] * num_rows
+        event_timestamps = [Timestamp()] * num_rows
+
         # Apply on demand transformations and augment the result rows
         odfv_result_names = set()
         for odfv_name, _feature_refs in odfv_feature_refs.items():
@@ -2091,23 +2641,16 @@ class FeatureStore:
                 f for f in transformed_features_df.columns if f in _feature_refs
             ]
 
-            proto_values = [
-                python_values_to_proto_values(
-                    transformed_features_df[feature].values, ValueType.UNKNOWN
-                )
-                for feature in selected_subset
-            ]
-
             odfv_result_names |= set(selected_subset)
 
             online_features_response.metadata.feature_names.val.extend(selected_subset)
-            for feature_idx in range(len(selected_subset)):
-                online_features_response.results.append(
-                    GetOnlineFeaturesResponse.FeatureVector(
-                        values=proto_values[feature_idx],
-                        statuses=[FieldStatus.PRESENT] * len(proto_values[feature_idx]),
-                        event_timestamps=[Timestamp()] * len(proto_values[feature_idx]),
-                    )
+            for feature in selected_subset:
+                online_features_response.results.add(
+                    values=python_values_to_proto_values(
+                        transformed_features_df[feature].values, ValueType.UNKNOWN
+                    ),
+                    statuses=statuses,
+                    event_timestamps=event_timestamps,
                 )
 
     @staticmethod
@@ -2124,18 +2667,29 @@ class FeatureStore:
             requested_result_row_names: Fields from 'result_rows' that have been requested, and
                     therefore should not be dropped.
         """
-        # Drop values that aren't needed
-        unneeded_feature_indices = [
+        # Drop values that aren't needed. Each del on a repeated proto field
+        # shifts every later element, so rebuild the containers in one pass
+        # instead of deleting index by index.
+        feature_names = online_features_response.metadata.feature_names.val
+        keep_indices = [
             idx
-            for idx, val in enumerate(
-                online_features_response.metadata.feature_names.val
-            )
-            if val not in requested_result_row_names
+            for idx, val in enumerate(feature_names)
+            if val in requested_result_row_names
         ]
+        if len(keep_indices) == len(feature_names):
+            return
+
+        kept_names = [feature_names[idx] for idx in keep_indices]
+        kept_results = []
+        for idx in keep_indices:
+            vector = GetOnlineFeaturesResponse.FeatureVector()
+            vector.CopyFrom(online_features_response.results[idx])
+            kept_results.append(vector)
 
-        for idx in reversed(unneeded_feature_indices):
-            del online_features_response.metadata.feature_names.val[idx]
-            del online_features_response.results[idx]
+        del feature_names[:]
+        feature_names.extend(kept_names)
+        del online_features_response.results[:]
+        online_features_response.results.extend(kept_results)
 
     def _get_feature_views_to_use(
         self,
@@ -2143,6 +2697,28 @@ class FeatureStore:
         allow_cache=False,
         hide_dummy_entity: bool = True,
     ) -> Tuple[List[FeatureView], List[RequestFeatureView], List[OnDemandFeatureView]]:
+        # The resolved views only depend on the registry contents and, for a feature
+        # service, on the service's projections; the result is cached with the same
+        # TTL as the registry cache. The cache is invalidated by apply, teardown and
+        # refresh_registry.
+        cache_key = None
+        if allow_cache:
+            # Feature services are keyed by their spec digest rather than their
+            # name: the resolved views are built from the passed object's
+            # projections, so a same-named service with different projections
+            # must not share a cache entry.
+            cache_key = (
+                _feature_service_spec_digest(features)
+                if isinstance(features, FeatureService)
+                else None,
+                hide_dummy_entity,
+            )
+            cached = self._feature_views_to_use_cache.get(cache_key)
+            if cached is not None:
+                views_to_use, cached_at = cached
+                ttl = self._registry_config.cache_ttl_seconds
+                if ttl <= 0 or time.monotonic() - cached_at < ttl:
+                    return views_to_use
 
         fvs = {
             fv.name: fv
@@ -2204,6 +2780,11 @@ class FeatureStore:
                 [*od_fvs.values()],
             )
 
+        if cache_key is not None:
+            self._feature_views_to_use_cache[cache_key] = (
+                views_to_use,
+                time.monotonic(),
+            )
         return views_to_use
 
     @log_exceptions_and_usage
@@ -2215,7 +2796,16 @@ class FeatureStore:
         no_access_log: bool,
         no_feature_log: bool,
     ) -> None:
-        """Start the feature consumption server locally on a given port."""
+        """Start the feature consumption server locally on a given port.
+
+        When the Go feature server is enabled, ``type_='grpc'`` is the
+        recommended option for performance-sensitive deployments: unary gRPC
+        avoids the HTTP/JSON encode-decode per request and keeps a single
+        multiplexed connection warm, which matters for large batch
+        ``get_online_features`` responses.
+        """
+        from feast import feature_server
+
         type_ = type_.lower()
         if self.config.go_feature_serving:
             # Start go server instead of python if the flag is enabled
@@ -2267,6 +2857,8 @@ class FeatureStore:
         self, host: str, port: int, get_registry_dump: Callable, registry_ttl_sec: int
     ) -> None:
         """Start the UI server locally"""
+        from feast import ui_server
+
         warnings.warn(
             "The Feast UI is an experimental feature. "
             "We do not guarantee that future changes will maintain backward compatibility.",
@@ -2281,6 +2873,50 @@ class FeatureStore:
             registry_ttl_sec=registry_ttl_sec,
         )
 
+    @log_exceptions_and_usage
+    def serve_all(
+        self,
+        host: str,
+        port: int,
+        get_registry_dump: Callable,
+        registry_ttl_sec: int,
+        no_access_log: bool = True,
+    ) -> None:
+        """Start the feature server and the UI server in a single event loop.
+
+        The feature server is mounted under ``/feature-server`` and the UI is
+        served from the root path, so a single uvicorn process and listener
+        handle both instead of two separate server processes.
+        """
+        import uvicorn
+        from fastapi import FastAPI
+
+        from feast import feature_server, ui_server
+
+        warnings.warn(
+            "The Feast UI is an experimental feature. "
+            "We do not guarantee that future changes will maintain backward compatibility.",
+            RuntimeWarning,
+        )
+
+        app = FastAPI()
+        app.mount("/feature-server", feature_server.get_app(self))
+        # The UI build references its assets from the root path, so it keeps
+        # the root mount; mounts are matched in order, so the feature server
+        # prefix is registered first.
+        app.mount(
+            "/",
+            ui_server.get_app(
+                self,
+                get_registry_dump,
+                self.config.project,
+                registry_ttl_sec,
+                host,
+                port,
+            ),
+        )
+        uvicorn.run(app, host=host, port=port, access_log=(not no_access_log))
+
     @log_exceptions_and_usage
     def serve_transformations(self, port: int) -> None:
         """Start the feature transformation server locally on a given port."""
@@ -2309,6 +2945,8 @@ class FeatureStore:
             logs: Arrow Table or path to parquet dataset directory on disk
             source: Object that produces logs
         """
+        import pyarrow as pa
+
         if not isinstance(source, FeatureService):
             raise ValueError("Only feature service is currently supported as a source")
 
@@ -2318,6 +2956,10 @@ class FeatureStore:
 
         assert isinstance(logs, (pa.Table, Path))
 
+        if _LOG_BATCH_SIZE > 0 and isinstance(logs, pa.Table):
+            self._buffer_logged_features(logs, source)
+            return
+
         self._get_provider().write_feature_service_logs(
             feature_service=source,
             logs=logs,
@@ -2325,6 +2967,51 @@ class FeatureStore:
             registry=self._registry,
         )
 
+    def _buffer_logged_features(self, logs: "pa.Table", source: FeatureService):
+        with self._log_buffer_lock:
+            _, tables = self._log_buffer.setdefault(source.name, (source, []))
+            tables.append(logs)
+            should_flush = sum(table.num_rows for table in tables) >= _LOG_BATCH_SIZE
+            if self._log_flusher is None:
+                self._log_flusher = threading.Thread(
+                    target=self._flush_logged_features_periodically, daemon=True
+                )
+                self._log_flusher.start()
+                atexit.register(self.flush_logged_features)
+        if should_flush:
+            self.flush_logged_features()
+
+    def _flush_logged_features_periodically(self):
+        while True:
+            time.sleep(_LOG_BATCH_INTERVAL_SECONDS)
+            try:
+                self.flush_logged_features()
+            except Exception:
+                # A transient store error must not kill the flusher thread;
+                # later buffered logs are flushed on the next wake-up.
+                _logger.exception("Failed to flush buffered feature logs")
+
+    def flush_logged_features(self):
+        """Write out any feature logs buffered by ``write_logged_features``."""
+        import pyarrow as pa
+
+        with self._log_buffer_lock:
+            pending = [
+                (source, pa.concat_tables(tables))
+                for source, tables in self._log_buffer.values()
+                if tables
+            ]
+            self._log_buffer.clear()
+
+        provider = self._get_provider()
+        for source, logs in pending:
+            provider.write_feature_service_logs(
+                feature_service=source,
+                logs=logs,
+                config=self.config,
+                registry=self._registry,
+            )
+
     @log_exceptions_and_usage
     def validate_logged_features(
         self,
@@ -2395,18 +3082,59 @@ class FeatureStore:
         Raises:
             ValidationReferenceNotFoundException: The validation reference could not be found.
         """
+        if allow_cache:
+            cached = self._validation_reference_cache.get(name)
+            if cached is not None:
+                ref, cached_at = cached
+                ttl = self._registry_config.cache_ttl_seconds
+                if ttl <= 0 or time.monotonic() - cached_at < ttl:
+                    return ref
+
         ref = self._registry.get_validation_reference(
             name, project=self.project, allow_cache=allow_cache
         )
         ref._dataset = self.get_saved_dataset(ref.dataset_name)
+        if allow_cache:
+            self._validation_reference_cache[name] = (ref, time.monotonic())
         return ref
 
 
+def _feature_service_spec_digest(feature_service: FeatureService) -> bytes:
+    """Returns a stable digest of a feature service's spec, cached on the object.
+
+    Comparing digests is much cheaper than FeatureService equality, which sorts and
+    compares every feature view projection in Python.
+    """
+    digest = feature_service._spec_digest
+    if digest is None:
+        digest = feature_service.to_proto().spec.SerializeToString(deterministic=True)
+        feature_service._spec_digest = digest
+    return digest
+
+
+def _validate_projection_feature(projection, feat_name: str):
+    """Checks that a feature belongs to a projection.
+
+    Equivalent to projection.get_feature, but a hashed membership test against
+    the projection's memoized name set instead of a linear scan over its fields
+    on every reference.
+    """
+    if feat_name not in projection.feature_name_set():
+        raise KeyError(
+            f"Feature {feat_name} not found in projection {projection.name_to_use()}"
+        )
+
+
 def _validate_entity_values(join_key_values: Dict[str, List[Value]]):
-    set_of_row_lengths = {len(v) for v in join_key_values.values()}
-    if len(set_of_row_lengths) > 1:
-        raise ValueError("All entity rows must have the same columns.")
-    return set_of_row_lengths.pop()
+    value_lists = iter(join_key_values.values())
+    first = next(value_lists, None)
+    if first is None:
+        return 0
+    num_rows = len(first)
+    for value_list in value_lists:
+        if len(value_list) != num_rows:
+            raise ValueError("All entity rows must have the same columns.")
+    return num_rows
 
 
 def _validate_feature_refs(feature_refs: List[str], full_feature_names: bool = False):
@@ -2422,25 +3150,25 @@ def _validate_feature_refs(feature_refs: List[str], full_feature_names: bool = F
     Raises:
         FeatureNameCollisionError: There is a collision among the feature references.
     """
-    collided_feature_refs = []
-
     if full_feature_names:
+        counts: Dict[str, int] = {}
+        for ref in feature_refs:
+            counts[ref] = counts.get(ref, 0) + 1
         collided_feature_refs = [
-            ref for ref, occurrences in Counter(feature_refs).items() if occurrences > 1
+            ref for ref, occurrences in counts.items() if occurrences > 1
         ]
     else:
-        feature_names = [ref.split(":")[1] for ref in feature_refs]
-        collided_feature_names = [
+        refs_by_feature_name: Dict[str, List[str]] = defaultdict(list)
+        for ref in feature_refs:
+            refs_by_feature_name[ref.rpartition(":")[2]].append(ref)
+
+        collided_feature_refs = [
             ref
-            for ref, occurrences in Counter(feature_names).items()
-            if occurrences > 1
+            for refs in refs_by_feature_name.values()
+            if len(refs) > 1
+            for ref in refs
         ]
 
-        for feature_name in collided_feature_names:
-            collided_feature_refs.extend(
-                [ref for ref in feature_refs if ref.endswith(":" + feature_name)]
-            )
-
     if len(collided_feature_refs) > 0:
         raise FeatureNameCollisionError(collided_feature_refs, full_feature_names)
 
@@ -2450,13 +3178,19 @@ def _group_feature_refs(
     all_feature_views: List[FeatureView],
     all_request_feature_views: List[RequestFeatureView],
     all_on_demand_feature_views: List[OnDemandFeatureView],
+    full_feature_names: Optional[bool] = None,
 ) -> Tuple[
     List[Tuple[FeatureView, List[str]]],
     List[Tuple[OnDemandFeatureView, List[str]]],
     List[Tuple[RequestFeatureView, List[str]]],
     Set[str],
 ]:
-    """Get list of feature views and corresponding feature names based on feature references"""
+    """Get list of feature views and corresponding feature names based on feature references.
+
+    When full_feature_names is not None, the references are also checked for
+    name collisions in the same pass, with the semantics of
+    _validate_feature_refs for that flag value.
+    """
 
     # view name to view proto
     view_index = {view.projection.name_to_use(): view for view in all_feature_views}
@@ -2479,30 +3213,71 @@ def _group_feature_refs(
     # on demand view name to feature names
     on_demand_view_features = defaultdict(set)
 
+    # Hoist the repeated lookups out of the loop: a single dict.get both tests
+    # membership and retrieves the view, instead of `in` followed by indexing.
+    view_index_get = view_index.get
+    on_demand_view_index_get = on_demand_view_index.get
+    request_view_index_get = request_view_index.get
+
+    ref_counts: Optional[Dict[str, int]] = None
+    refs_by_feature_name: Optional[Dict[str, List[str]]] = None
+    if full_feature_names is True:
+        ref_counts = {}
+    elif full_feature_names is False:
+        refs_by_feature_name = defaultdict(list)
+
     for ref in features:
-        view_name, feat_name = ref.split(":")
-        if view_name in view_index:
-            view_index[view_name].projection.get_feature(feat_name)  # For validation
+        view_name, _, feat_name = ref.partition(":")
+        if ref_counts is not None:
+            ref_counts[ref] = ref_counts.get(ref, 0) + 1
+        elif refs_by_feature_name is not None:
+            refs_by_feature_name[feat_name].append(ref)
+        view = view_index_get(view_name)
+        if view is not None:
+            _validate_projection_feature(view.projection, feat_name)
             views_features[view_name].add(feat_name)
-        elif view_name in on_demand_view_index:
-            on_demand_view_index[view_name].projection.get_feature(
-                feat_name
-            )  # For validation
+            continue
+        odfv = on_demand_view_index_get(view_name)
+        if odfv is not None:
+            _validate_projection_feature(odfv.projection, feat_name)
             on_demand_view_features[view_name].add(feat_name)
-            # Let's also add in any FV Feature dependencies here.
-            for input_fv_projection in on_demand_view_index[
-                view_name
-            ].source_feature_view_projections.values():
-                for input_feat in input_fv_projection.features:
-                    views_features[input_fv_projection.name].add(input_feat.name)
-        elif view_name in request_view_index:
-            request_view_index[view_name].projection.get_feature(
-                feat_name
-            )  # For validation
+            # Let's also add in any FV Feature dependencies here. The expansion of
+            # input projections into feature names is the same for every reference
+            # into the view, so compute it once and reuse it on subsequent hits.
+            input_features = odfv._cached_input_fv_features
+            if input_features is None:
+                input_features = [
+                    (input_fv_projection.name, input_feat.name)
+                    for input_fv_projection in odfv.source_feature_view_projections.values()
+                    for input_feat in input_fv_projection.features
+                ]
+                odfv._cached_input_fv_features = input_features
+            for input_view_name, input_feat_name in input_features:
+                views_features[input_view_name].add(input_feat_name)
+            continue
+        request_view = request_view_index_get(view_name)
+        if request_view is not None:
+            _validate_projection_feature(request_view.projection, feat_name)
             request_views_features[view_name].add(feat_name)
             request_view_refs.add(ref)
-        else:
-            raise FeatureViewNotFoundException(view_name)
+            continue
+        raise FeatureViewNotFoundException(view_name)
+
+    if ref_counts is not None:
+        collided_feature_refs = [
+            ref for ref, occurrences in ref_counts.items() if occurrences > 1
+        ]
+        if collided_feature_refs:
+            raise FeatureNameCollisionError(collided_feature_refs, True)
+    elif refs_by_feature_name is not None:
+        collided_feature_refs = [
+            ref
+            for refs in refs_by_feature_name.values()
+            if len(refs) > 1
+            for ref in refs
+        ]
+        if collided_feature_refs:
+            raise FeatureNameCollisionError(collided_feature_refs, False)
 
     fvs_result: List[Tuple[FeatureView, List[str]]] = []
     odfvs_result: List[Tuple[OnDemandFeatureView, List[str]]] = []
@@ -2520,24 +3295,32 @@ def _group_feature_refs(
 def _print_materialization_log(
     start_date, end_date, num_feature_views: int, online_store: str
 ):
+    from colorama import Fore, Style
+
+    green = Style.BRIGHT + Fore.GREEN
+    reset = Style.RESET_ALL
+
     if start_date:
         print(
-            f"Materializing {Style.BRIGHT + Fore.GREEN}{num_feature_views}{Style.RESET_ALL} feature views"
-            f" from {Style.BRIGHT + Fore.GREEN}{start_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}"
-            f" to {Style.BRIGHT + Fore.GREEN}{end_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}"
-            f" into the {Style.BRIGHT + Fore.GREEN}{online_store}{Style.RESET_ALL} online store.\n"
+            f"Materializing {green}{num_feature_views}{reset} feature views"
+            f" from {green}{start_date.replace(microsecond=0).astimezone()}{reset}"
+            f" to {green}{end_date.replace(microsecond=0).astimezone()}{reset}"
+            f" into the {green}{online_store}{reset} online store.\n",
+            flush=True,
         )
     else:
         print(
-            f"Materializing {Style.BRIGHT + Fore.GREEN}{num_feature_views}{Style.RESET_ALL} feature views"
-            f" to {Style.BRIGHT + Fore.GREEN}{end_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}"
-            f" into the {Style.BRIGHT + Fore.GREEN}{online_store}{Style.RESET_ALL} online store.\n"
+            f"Materializing {green}{num_feature_views}{reset} feature views"
+            f" to {green}{end_date.replace(microsecond=0).astimezone()}{reset}"
+            f" into the {green}{online_store}{reset} online store.\n",
+            flush=True,
         )
 
 
-def _validate_feature_views(feature_views: List[BaseFeatureView]):
+def _validate_feature_views(feature_views: Iterable[BaseFeatureView]):
     """Verify feature views have case-insensitively unique names"""
-    fv_names = set()
+    fv_names: Set[str] = set()
+    add_fv_name = fv_names.add
     for fv in feature_views:
         case_insensitive_fv_name = fv.name.lower()
         if case_insensitive_fv_name in fv_names:
@@ -2546,35 +3329,29 @@ def _validate_feature_views(feature_views: List[BaseFeatureView]):
                 f"Please ensure that all feature view names are case-insensitively unique. "
                 f"It may be necessary to ignore certain files in your feature repository by using a .feastignore file."
             )
-        else:
-            fv_names.add(case_insensitive_fv_name)
+        add_fv_name(case_insensitive_fv_name)
 
 
 def _validate_data_sources(data_sources: List[DataSource]):
     """Verify data sources have case-insensitively unique names"""
-    ds_names = set()
+    ds_names: Set[str] = set()
+    add_ds_name = ds_names.add
+    duplicated_ds_names: Set[str] = set()
     for ds in data_sources:
         case_insensitive_ds_name = ds.name.lower()
         if case_insensitive_ds_name in ds_names:
             if case_insensitive_ds_name.strip():
-                warnings.warn(
-                    f"More than one data source with name {case_insensitive_ds_name} found. "
-                    f"Please ensure that all data source names are case-insensitively unique. "
-                    f"It may be necessary to ignore certain files in your feature repository by using a .feastignore "
-                    f"file. Starting in Feast 0.24, unique names (perhaps inferred from the table name) will be "
-                    f"required in data sources to encourage data source discovery"
-                )
+                duplicated_ds_names.add(case_insensitive_ds_name)
         else:
-            ds_names.add(case_insensitive_ds_name)
+            add_ds_name(case_insensitive_ds_name)
 
+    if duplicated_ds_names:
+        warnings.warn(
+            f"More than one data source with names {sorted(duplicated_ds_names)} found. "
+            f"Please ensure that all data source names are case-insensitively unique. "
+            f"It may be necessary to ignore certain files in your feature repository by using a .feastignore "
+            f"file. Starting in Feast 0.24, unique names (perhaps inferred from the table name) will be "
+            f"required in data sources to encourage data source discovery"
+        )
 
-def apply_list_mapping(
-    lst: Iterable[Any], mapping_indexes: Iterable[List[int]]
-) -> Iterable[Any]:
-    output_len = sum(len(item) for item in mapping_indexes)
-    output = [None] * output_len
-    for elem, destinations in zip(lst, mapping_indexes):
-        for idx in destinations:
-            output[idx] = elem
 
-    return output
@@ -97,6 +97,16 @@ class FeatureView(BaseFeatureView):
     materialization_intervals: List[Tuple[datetime, datetime]]
     source: Optional[DataSource]
 
+    # Lazily computed by has_dummy_entity; not part of the proto representation.
+    _has_dummy_entity: Optional[bool] = None
+
+    # Lazily populated by the online retrieval path with formatted response
+    # feature refs, keyed by requested features and the full-feature-names
+    # flag; not part of the proto representation.
+    _cached_response_refs: Optional[
+        Dict[Tuple[Tuple[str, ...], bool], List[str]]
+    ] = None
+
     @log_exceptions
     def __init__(
         self,
@@ -305,6 +315,20 @@ class FeatureView(BaseFeatureView):
     def __hash__(self):
         return super().__hash__()
 
+    @property
+    def has_dummy_entity(self) -> bool:
+        """Returns whether this feature view was defined without entities.
+
+        Entityless feature views are backed by DUMMY_ENTITY internally. The result is
+        cached on first access, so the flag stays valid after the dummy entity has
+        been hidden by setting `entities` to an empty list.
+        """
+        if self._has_dummy_entity is None:
+            self._has_dummy_entity = (
+                bool(self.entities) and self.entities[0] == DUMMY_ENTITY_NAME
+            )
+        return self._has_dummy_entity
+
     def __copy__(self):
         fv = FeatureView(
             name=self.name,
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional
 
 from attr import dataclass
 
@@ -68,6 +68,18 @@ class FeatureViewProjection:
             desired_features=[],
         )
 
+    def feature_name_set(self) -> FrozenSet[str]:
+        """Returns the names of the features in this projection.
+
+        The set is memoized on the instance so membership checks on hot paths
+        are a single hashed lookup instead of a scan over the feature list.
+        """
+        names = getattr(self, "_feature_name_set", None)
+        if names is None:
+            names = frozenset(field.name for field in self.features)
+            self._feature_name_set = names
+        return names
+
     def get_feature(self, feature_name: str) -> Field:
         try:
             return next(field for field in self.features if field.name == feature_name)
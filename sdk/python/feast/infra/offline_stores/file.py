@@ -1,3 +1,4 @@
+import shutil
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -393,15 +394,29 @@ class FileOfflineStore(OfflineStore):
         destination = logging_config.destination
         assert isinstance(destination, FileLoggingDestination)
 
-        if isinstance(data, Path):
-            # Since this code will be mostly used from Go-created thread, it's better to avoid producing new threads
-            data = pyarrow.parquet.read_table(data, use_threads=False, pre_buffer=False)
-
         filesystem, path = FileSource.create_filesystem_and_path(
             destination.path,
             destination.s3_endpoint_override,
         )
 
+        if isinstance(data, Path):
+            if filesystem is None and not destination.partition_by:
+                # The logger already produced Parquet files; when the
+                # destination is an unpartitioned local dataset they can be
+                # moved into place as-is instead of being decoded and
+                # re-encoded through write_dataset.
+                destination_dir = Path(path)
+                destination_dir.mkdir(parents=True, exist_ok=True)
+                prefix = uuid.uuid4().hex
+                for i, file in enumerate(sorted(data.glob("**/*.parquet"))):
+                    shutil.copy(
+                        str(file), str(destination_dir / f"{prefix}-{i}.parquet")
+                    )
+                return
+
+            # Since this code will be mostly used from Go-created thread, it's better to avoid producing new threads
+            data = pyarrow.parquet.read_table(data, use_threads=False, pre_buffer=False)
+
         pyarrow.dataset.write_dataset(
             data,
             base_dir=path,
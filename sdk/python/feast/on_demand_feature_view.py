@@ -3,7 +3,7 @@ import functools
 import warnings
 from datetime import datetime
 from types import FunctionType
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import dill
 import pandas as pd
@@ -71,6 +71,11 @@ class OnDemandFeatureView(BaseFeatureView):
     tags: Dict[str, str]
     owner: str
 
+    # Lazily populated by the online retrieval path with the flattened
+    # (input view name, feature name) pairs of the source projections; not
+    # part of the proto representation.
+    _cached_input_fv_features: Optional[List[Tuple[str, str]]] = None
+
     @log_exceptions  # noqa: C901
     def __init__(  # noqa: C901
         self,
@@ -21,7 +21,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
 import dill
@@ -173,6 +173,23 @@ class BaseRegistry(abc.ABC):
             commit: Whether the change should be persisted immediately
         """
 
+    def apply_entities(self, entities: List[Entity], project: str, commit: bool = True):
+        """
+        Registers multiple entities with Feast in one operation.
+
+        The default implementation delegates to apply_entity per entity and defers
+        the commit until the end; registries with cheaper bulk writes can override.
+
+        Args:
+            entities: Entities that will be registered
+            project: Feast project that the entities belong to
+            commit: Whether the change should be persisted immediately
+        """
+        for entity in entities:
+            self.apply_entity(entity, project, commit=False)
+        if commit:
+            self.commit()
+
     @abstractmethod
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         """
@@ -226,6 +243,26 @@ class BaseRegistry(abc.ABC):
             commit: Whether the change should be persisted immediately
         """
 
+    def apply_data_sources(
+        self, data_sources: List[DataSource], project: str, commit: bool = True
+    ):
+        """
+        Registers multiple data sources with Feast in one operation.
+
+        The default implementation delegates to apply_data_source per source and
+        defers the commit until the end; registries with cheaper bulk writes can
+        override.
+
+        Args:
+            data_sources: Data sources that will be registered
+            project: Feast project that the data sources belong to
+            commit: Whether to immediately commit to the registry
+        """
+        for data_source in data_sources:
+            self.apply_data_source(data_source, project, commit=False)
+        if commit:
+            self.commit()
+
     @abstractmethod
     def get_data_source(
         self, name: str, project: str, allow_cache: bool = False
@@ -327,6 +364,29 @@ class BaseRegistry(abc.ABC):
             commit: Whether the change should be persisted immediately
         """
 
+    def apply_feature_views(
+        self,
+        feature_views: Iterable[BaseFeatureView],
+        project: str,
+        commit: bool = True,
+    ):
+        """
+        Registers multiple feature views with Feast in one operation.
+
+        The default implementation delegates to apply_feature_view per view and
+        defers the commit until the end; registries with cheaper bulk writes can
+        override.
+
+        Args:
+            feature_views: Feature views that will be registered
+            project: Feast project that the feature views belong to
+            commit: Whether the change should be persisted immediately
+        """
+        for feature_view in feature_views:
+            self.apply_feature_view(feature_view, project, commit=False)
+        if commit:
+            self.commit()
+
     @abstractmethod
     def delete_feature_view(self, name: str, project: str, commit: bool = True):
         """
@@ -338,6 +398,26 @@ class BaseRegistry(abc.ABC):
             commit: Whether the change should be persisted immediately
         """
 
+    def delete_feature_views(
+        self, names: Iterable[str], project: str, commit: bool = True
+    ):
+        """
+        Deletes multiple feature views or raises an exception if one is not found.
+
+        The default implementation delegates to delete_feature_view per name and
+        defers the commit until the end; registries with cheaper bulk writes can
+        override.
+
+        Args:
+            names: Names of the feature views to delete
+            project: Feast project that the feature views belong to
+            commit: Whether the change should be persisted immediately
+        """
+        for name in names:
+            self.delete_feature_view(name, project, commit=False)
+        if commit:
+            self.commit()
+
     # stream feature view operations
     @abstractmethod
     def get_stream_feature_view(
@@ -1185,6 +1265,30 @@ class Registry(BaseRegistry):
         if commit:
             self.commit()
 
+    def apply_feature_views(
+        self,
+        feature_views: Iterable[BaseFeatureView],
+        project: str,
+        commit: bool = True,
+    ):
+        """
+        Registers multiple feature views with Feast in one batch.
+
+        The registry cache is refreshed at most once for the whole batch, every
+        view is applied against the in-memory proto, and a single serialized
+        write happens at commit time.
+
+        Args:
+            feature_views: Feature views that will be registered
+            project: Feast project that the feature views belong to
+            commit: Whether the change should be persisted immediately
+        """
+        self._prepare_registry_for_changes(project)
+        for feature_view in feature_views:
+            self.apply_feature_view(feature_view, project, commit=False)
+        if commit:
+            self.commit()
+
     def list_stream_feature_views(
         self, project: str, allow_cache: bool = False
     ) -> List[StreamFeatureView]:
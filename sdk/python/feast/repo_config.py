@@ -146,6 +146,12 @@ class RepoConfig(FeastBaseModel):
     go_feature_retrieval: Optional[bool] = False
     """ If True, use the embedded Go code to retrieve features instead of the Python SDK. """
 
+    materialization_max_workers: StrictInt = 1
+    """ int: Maximum number of feature views to materialize concurrently. The default of 1
+    materializes feature views sequentially; higher values run the per-view materialization
+    in a thread pool, which can shorten wall time substantially when materializing many
+    independent feature views against I/O-bound stores. """
+
     entity_key_serialization_version: StrictInt = 1
     """ Entity key serialization version: This version is used to control what serialization scheme is
     used when writing data to the online store.
@@ -373,6 +373,9 @@ def _python_value_to_proto_value(
         ) = PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE[feast_value_type]
         if valid_scalar_types:
             assert type(sample) in valid_scalar_types
+        # Null-check the whole batch in one vectorized call; pd.isnull per
+        # element dominates the conversion cost for large batches.
+        nulls = pd.isnull(values)
         if feast_value_type == ValueType.BOOL:
             # ProtoValue does not support conversion of np.bool_ so we need to convert it to support np.bool_.
             return [
@@ -383,16 +386,17 @@ def _python_value_to_proto_value(
                         )
                     }
                 )
-                if not pd.isnull(value)
+                if not null
                 else ProtoValue()
-                for value in values
+                for value, null in zip(values, nulls)
             ]
         if feast_value_type in PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE:
+            if not nulls.any():
+                # Fast path for clean batches, the common case for entity keys.
+                return [ProtoValue(**{field_name: func(value)}) for value in values]
             return [
-                ProtoValue(**{field_name: func(value)})
-                if not pd.isnull(value)
-                else ProtoValue()
-                for value in values
+                ProtoValue(**{field_name: func(value)}) if not null else ProtoValue()
+                for value, null in zip(values, nulls)
             ]
 
     raise Exception(f"Unsupported data type: ${str(type(values[0]))}")
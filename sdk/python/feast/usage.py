@@ -306,6 +306,38 @@ def log_exceptions_and_usage(*args, **attrs):
     return decorator
 
 
+def log_sampled_usage(*args, **attrs):
+    """
+    Lightweight variant of log_exceptions_and_usage for helpers on hot paths.
+
+    When the decorated function is invoked from inside an outer usage context
+    (i.e. a caller already decorated with log_exceptions_and_usage), the call is
+    forwarded directly without allocating a nested FnCall, saving a timestamp,
+    uuid and context update per invocation. Root-level calls are tracked
+    exactly like log_exceptions_and_usage.
+    """
+
+    def decorator(func):
+        if not _is_enabled:
+            return func
+
+        tracked = log_exceptions_and_usage(**attrs)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _context.get().call_stack:
+                # Already tracked by an outer decorated call; skip the bookkeeping.
+                return func(*args, **kwargs)
+            return tracked(*args, **kwargs)
+
+        return wrapper
+
+    if args:
+        return decorator(args[0])
+
+    return decorator
+
+
 def log_exceptions(*args, **attrs):
     """
     Function decorator that track errors and send them to Feast Developers
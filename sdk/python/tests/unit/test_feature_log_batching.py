@@ -0,0 +1,80 @@
+import threading
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+
+import feast.feature_store
+from feast.feature_store import FeatureStore
+
+
+@dataclass
+class MockFeatureService:
+    name: str
+
+
+class MockFeatureStore:
+    """Bare-bones stand-in carrying only the state the log buffering uses."""
+
+    _buffer_logged_features = FeatureStore._buffer_logged_features
+    flush_logged_features = FeatureStore.flush_logged_features
+
+    def __init__(self):
+        self._log_buffer = {}
+        self._log_buffer_lock = threading.Lock()
+        # Pretend the flusher thread is already running so buffering does not
+        # start a real daemon thread or register an atexit hook.
+        self._log_flusher = MagicMock()
+        self.config = MagicMock()
+        self._registry = MagicMock()
+        self.provider = MagicMock()
+
+    def _get_provider(self):
+        return self.provider
+
+
+def _logs_table(num_rows: int) -> pa.Table:
+    return pa.table({"driver_id": list(range(num_rows))})
+
+
+def test_buffer_flushes_once_batch_size_reached(monkeypatch):
+    monkeypatch.setattr(feast.feature_store, "_LOG_BATCH_SIZE", 5)
+    store = MockFeatureStore()
+    service = MockFeatureService(name="driver_service")
+
+    store._buffer_logged_features(_logs_table(2), service)
+    store.provider.write_feature_service_logs.assert_not_called()
+
+    store._buffer_logged_features(_logs_table(3), service)
+    store.provider.write_feature_service_logs.assert_called_once()
+    _, kwargs = store.provider.write_feature_service_logs.call_args
+    assert kwargs["feature_service"] is service
+    assert kwargs["logs"].num_rows == 5
+    assert store._log_buffer == {}
+
+
+def test_flush_writes_each_service_separately(monkeypatch):
+    monkeypatch.setattr(feast.feature_store, "_LOG_BATCH_SIZE", 100)
+    store = MockFeatureStore()
+    service_a = MockFeatureService(name="service_a")
+    service_b = MockFeatureService(name="service_b")
+
+    store._buffer_logged_features(_logs_table(1), service_a)
+    store._buffer_logged_features(_logs_table(2), service_a)
+    store._buffer_logged_features(_logs_table(3), service_b)
+    store.provider.write_feature_service_logs.assert_not_called()
+
+    store.flush_logged_features()
+    calls = store.provider.write_feature_service_logs.call_args_list
+    assert len(calls) == 2
+    rows_by_service = {
+        kwargs["feature_service"].name: kwargs["logs"].num_rows for _, kwargs in calls
+    }
+    assert rows_by_service == {"service_a": 3, "service_b": 3}
+    assert store._log_buffer == {}
+
+
+def test_flush_with_empty_buffer_writes_nothing():
+    store = MockFeatureStore()
+    store.flush_logged_features()
+    store.provider.write_feature_service_logs.assert_not_called()
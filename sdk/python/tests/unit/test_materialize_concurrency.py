@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from feast.feature_store import FeatureStore
+
+
+class MockFeatureStore:
+    """Bare-bones stand-in carrying only the state materialization uses."""
+
+    _materialize_feature_views = FeatureStore._materialize_feature_views
+
+    def __init__(self, max_workers: int):
+        self.config = MagicMock()
+        self.config.materialization_max_workers = max_workers
+        self._registry = MagicMock()
+        self.project = "test_project"
+
+
+def _views_with_ranges(num_views: int):
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=1)
+    return [(MagicMock(name=f"fv_{i}"), start_date, end_date) for i in range(num_views)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_materialize_feature_views_covers_all_views(max_workers):
+    store = MockFeatureStore(max_workers=max_workers)
+    provider = MagicMock()
+    tqdm_builder = MagicMock()
+    views_with_ranges = _views_with_ranges(3)
+
+    store._materialize_feature_views(provider, views_with_ranges, tqdm_builder)
+
+    materialized = {
+        kwargs["feature_view"]
+        for _, kwargs in provider.materialize_single_feature_view.call_args_list
+    }
+    assert materialized == {fv for fv, _, _ in views_with_ranges}
+    store._registry.apply_materialization.assert_has_calls(
+        [
+            call(fv, "test_project", start_date, end_date)
+            for fv, start_date, end_date in views_with_ranges
+        ]
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_materialize_feature_views_propagates_errors(max_workers):
+    store = MockFeatureStore(max_workers=max_workers)
+    provider = MagicMock()
+    provider.materialize_single_feature_view.side_effect = RuntimeError("boom")
+    views_with_ranges = _views_with_ranges(2)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        store._materialize_feature_views(provider, views_with_ranges, MagicMock())
+
+    store._registry.apply_materialization.assert_not_called()
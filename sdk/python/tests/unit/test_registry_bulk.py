@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from feast.registry import BaseRegistry
+
+
+def test_apply_entities_applies_each_and_commits_once():
+    registry = MagicMock()
+    entities = [MagicMock(), MagicMock()]
+
+    BaseRegistry.apply_entities(registry, entities, "test_project")
+
+    registry.apply_entity.assert_has_calls(
+        [call(entity, "test_project", commit=False) for entity in entities]
+    )
+    registry.commit.assert_called_once()
+
+
+def test_apply_data_sources_applies_each_and_commits_once():
+    registry = MagicMock()
+    data_sources = [MagicMock(), MagicMock(), MagicMock()]
+
+    BaseRegistry.apply_data_sources(registry, data_sources, "test_project")
+
+    registry.apply_data_source.assert_has_calls(
+        [call(source, "test_project", commit=False) for source in data_sources]
+    )
+    registry.commit.assert_called_once()
+
+
+def test_apply_feature_views_applies_each_and_commits_once():
+    registry = MagicMock()
+    feature_views = [MagicMock(), MagicMock()]
+
+    BaseRegistry.apply_feature_views(registry, feature_views, "test_project")
+
+    registry.apply_feature_view.assert_has_calls(
+        [call(view, "test_project", commit=False) for view in feature_views]
+    )
+    registry.commit.assert_called_once()
+
+
+def test_delete_feature_views_deletes_each_and_commits_once():
+    registry = MagicMock()
+
+    BaseRegistry.delete_feature_views(registry, ["fv_1", "fv_2"], "test_project")
+
+    registry.delete_feature_view.assert_has_calls(
+        [call(name, "test_project", commit=False) for name in ["fv_1", "fv_2"]]
+    )
+    registry.commit.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        ("apply_entities", [MagicMock()]),
+        ("apply_data_sources", [MagicMock()]),
+        ("apply_feature_views", [MagicMock()]),
+        ("delete_feature_views", ["fv_1"]),
+    ],
+)
+def test_bulk_methods_defer_commit_when_disabled(method, args):
+    registry = MagicMock()
+
+    getattr(BaseRegistry, method)(registry, args, "test_project", commit=False)
+
+    registry.commit.assert_not_called()
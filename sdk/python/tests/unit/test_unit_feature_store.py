@@ -36,15 +36,47 @@ def test_get_unique_entities():
         projection=MockFeatureViewProjection(join_key_map={}),
     )
 
-    unique_entities, indexes = FeatureStore._get_unique_entities(
+    join_keys, unique_entities, indexes = FeatureStore._get_unique_entities(
         FeatureStore,
         table=fv,
         join_key_values=entity_values,
         entity_name_to_join_key_map=entity_name_to_join_key_map,
     )
 
+    assert join_keys == ("entity_1", "entity_2")
     assert unique_entities == (
-        {"entity_1": Value(int64_val=1), "entity_2": Value(string_val="1")},
-        {"entity_1": Value(int64_val=2), "entity_2": Value(string_val="2")},
+        (Value(int64_val=1), Value(string_val="1")),
+        (Value(int64_val=2), Value(string_val="2")),
+    )
+    assert indexes == ([0, 2], [1])
+
+
+def test_get_unique_entities_single_join_key():
+    # A single join key takes a fast path that groups on the bare scalar
+    # instead of a tuple per row.
+    entity_values = {
+        "entity_1": [Value(int64_val=1), Value(int64_val=2), Value(int64_val=1)],
+        "entity_3": [Value(int64_val=8), Value(int64_val=9), Value(int64_val=10)],
+    }
+
+    entity_name_to_join_key_map = {"entity_1": "entity_1"}
+
+    fv = MockFeatureView(
+        name="fv_1",
+        entities=["entity_1"],
+        projection=MockFeatureViewProjection(join_key_map={}),
+    )
+
+    join_keys, unique_entities, indexes = FeatureStore._get_unique_entities(
+        FeatureStore,
+        table=fv,
+        join_key_values=entity_values,
+        entity_name_to_join_key_map=entity_name_to_join_key_map,
+    )
+
+    assert join_keys == ("entity_1",)
+    assert unique_entities == (
+        (Value(int64_val=1),),
+        (Value(int64_val=2),),
     )
     assert indexes == ([0, 2], [1])